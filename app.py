@@ -4,11 +4,18 @@ Entries point for the Streamlit App
 """
 
 import streamlit as st
+import hashlib
+import os
+import string
 import time
 import config
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Core Application Imports (Lightweight)
+# `src` and `src.models` resolve analyzer classes lazily, so these stay cheap
+import src
+from src import models
 from src.auth import authentication, session_manager
 from src.ui import components
 from src.utils.logger import get_logger
@@ -27,36 +34,19 @@ logger = get_logger(__name__)
 
 # --- UI Helpers ---
 
-def render_navbar():
-    """Render the premium glassmorphic navigation bar"""
-    
-    # Determine button to show
-    if session_manager.is_authenticated():
-        # Optional: Show Logout or Dashboard link if needed, or nothing
-        btn_html = "" 
-    else:
-        btn_html = '<a href="?nav=login" target="_self" style="text-decoration: none;"><button class="nav-btn">Sign In</button></a>'
+# Served from ./static at /app/static by server.enableStaticServing.
+# WebP (~10KB) is preferred over the original PNG (~90KB).
+LOGO_FILES = ("logo.webp", "logo.png")
 
-    import base64
-    import os
-    
-    # Check for custom logo
-    logo_path = "assets/logo.png"
-    logo_html = ""
-    
-    if os.path.exists(logo_path):
-        try:
-            with open(logo_path, "rb") as f:
-                data = f.read()
-                encoded = base64.b64encode(data).decode()
-            logo_html = f'<img src="data:image/png;base64,{encoded}" style="height: 50px; margin-right: 15px;">'
-        except Exception as e:
-            logger.error(f"Failed to load logo: {e}")
-            logo_html = '<span style="color: #14B8A6; font-size: 1.8rem; margin-right: 10px;">🛡️</span>'
-    else:
-        logo_html = '<span style="color: #14B8A6; font-size: 1.8rem; margin-right: 10px;">🛡️</span>'
+@st.cache_data
+def _logo_src(static_dir="static"):
+    """Static URL for the logo, or None if no logo file exists (checked once per process)"""
+    for name in LOGO_FILES:
+        if os.path.exists(os.path.join(static_dir, name)):
+            return f"./app/static/{name}"
+    return None
 
-    st.markdown(f"""
+_NAV_TEMPLATE = """
         <div class="nav-container">
             <div class="nav-logo">
                 {logo_html}
@@ -65,11 +55,15 @@ def render_navbar():
                 {btn_html}
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
 
-def render_footer():
-    """Render the professional company footer"""
-    st.markdown("""
+# Navbar action per auth state (authenticated users get no button for now)
+_NAV_BUTTONS = {
+    True: "",
+    False: '<a href="?nav=login" target="_self" style="text-decoration: none;"><button class="nav-btn">Sign In</button></a>',
+}
+
+_FOOTER_HTML = """
         <div class="footer-container">
             <div class="footer-content">
                 <div>
@@ -93,43 +87,188 @@ def render_footer():
                 &copy; 2026 SatyaSetu Labs. All Rights Reserved. | Dedicated to Digital Integrity
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+@st.cache_data
+def _navbar_html(authenticated: bool) -> str:
+    """Build the navbar markup once per auth state"""
+    logo_src = _logo_src()
+    if logo_src:
+        logo_html = f'<img src="{logo_src}" style="height: 50px; margin-right: 15px;">'
+    else:
+        logo_html = '<span style="color: #14B8A6; font-size: 1.8rem; margin-right: 10px;">🛡️</span>'
+    return _NAV_TEMPLATE.format(logo_html=logo_html, btn_html=_NAV_BUTTONS[authenticated])
+
+def render_navbar():
+    """Render the premium glassmorphic navigation bar"""
+    st.markdown(_navbar_html(bool(session_manager.is_authenticated())), unsafe_allow_html=True)
+
+def render_footer():
+    """Render the professional company footer"""
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+
+# Left-column branding shared by the login and signup pages
+_BRAND_TMPL = string.Template("""
+            <div style='display: flex; flex-direction: column; justify-content: center; height: 100%; padding-right: 40px; border-right: 1px solid rgba(148, 163, 184, 0.1);'>
+                ${logo_html}
+                <h1 style='font-size: 4rem; margin-bottom: 15px;'>${title}</h1>
+                <p style='color: #94A3B8; font-size: 1.5rem;'>
+                    ${lead} <br>
+                    <span class='neon-text' style='font-weight: 600;'>${highlight}</span>
+                </p>
+            </div>
+        """)
+
+def _brand_logo_html():
+    logo_src = _logo_src()
+    if logo_src:
+        return f'<img src="{logo_src}" style="width: 200px; margin-bottom: 25px;">'
+    return '<div style="font-size: 100px;">🛡️</div>'
+
+@st.cache_data
+def _branding_html(title, lead, highlight):
+    """Fully rendered branding column; form pages rerun on every submit, this doesn't"""
+    return _BRAND_TMPL.substitute(
+        logo_html=_brand_logo_html(), title=title, lead=lead, highlight=highlight
+    )
 
 # --- Load Models (Memory Efficient & Robust) ---
-def load_fast_components():
-    """Load lightweight heuristic components for instant verification"""
-    components = {}
+# Each layer is its own cached resource so a scan only pays for the models it
+# actually uses. Analyzer classes are resolved lazily by the `src` /
+# `src.models` packages, so spaCy, torch and transformers are only imported
+# once the matching getter runs. A getter returns None if its layer fails to load.
+# torch's process-wide thread caps are set by the first torch layer to load,
+# before its model is built (the landing page never imports torch).
+
+def _load_layer(name, factory, uses_torch=False):
     try:
-        from src.preprocessing import TextPreprocessor
-        components['preprocessor'] = TextPreprocessor()
-        from src.linguistic_analysis import LinguisticAnalyzer
-        components['linguistic_analyzer'] = LinguisticAnalyzer()
-        from src.credibility_scorer import CredibilityScorer
-        components['scorer'] = CredibilityScorer()
-        from src.source_verifier import SourceVerifier
-        components['source_verifier'] = SourceVerifier()
-        from src.entity_verifier import EntityVerifier
-        components['entity_verifier'] = EntityVerifier()
+        if uses_torch:
+            from src.utils.torch_threads import configure_torch_threads
+            configure_torch_threads()
+        return factory()
     except Exception as e:
-        logger.warning(f"Fast components failed: {e}")
-    return components
+        logger.warning(f"{name} failed to load: {e}")
+        return None
 
+# Fast (heuristic) layers
 @st.cache_resource
-def load_deep_components():
-    """Load heavy transformer models for deep analysis"""
-    components = {}
-    try:
-        from src.models.deberta_classifier import DebertaClassifier
-        components['classifier'] = DebertaClassifier()
-        from src.models.semantic_verifier import SemanticVerifier
-        components['verifier'] = SemanticVerifier()
-        from src.summarizer import Summarizer
-        components['summarizer'] = Summarizer()
-        from src.bias_sentiment_analyzer import BiasSentimentAnalyzer
-        components['bias_analyzer'] = BiasSentimentAnalyzer()
-    except Exception as e:
-        logger.warning(f"Deep components failed: {e}")
-    return components
+def get_preprocessor():
+    return _load_layer("TextPreprocessor", lambda: src.TextPreprocessor())
+
+@st.cache_resource
+def get_linguistic_analyzer():
+    return _load_layer("LinguisticAnalyzer", lambda: src.LinguisticAnalyzer())
+
+@st.cache_resource
+def get_scorer():
+    return _load_layer("CredibilityScorer", lambda: src.CredibilityScorer())
+
+@st.cache_resource
+def get_source_verifier():
+    return _load_layer("SourceVerifier", lambda: src.SourceVerifier())
+
+@st.cache_resource
+def get_entity_verifier():
+    return _load_layer("EntityVerifier", lambda: src.EntityVerifier())
+
+# Deep (transformer) layers
+@st.cache_resource
+def get_classifier():
+    return _load_layer("DebertaClassifier", lambda: models.DebertaClassifier(), uses_torch=True)
+
+@st.cache_resource
+def get_verifier():
+    return _load_layer("SemanticVerifier", lambda: models.SemanticVerifier(), uses_torch=True)
+
+# Trusted knowledge base for claim cross-referencing (Layer 6.5)
+TRUSTED_SOURCES = (
+    "Official records and news confirm recent reports.",
+)
+
+@st.cache_resource
+def get_trusted_source_embeddings():
+    """Encode TRUSTED_SOURCES once per process (None if the verifier is unavailable)"""
+    verifier = get_verifier()
+    if verifier is None:
+        return None
+    return _load_layer("Trusted source embeddings", lambda: verifier.encode_sources(TRUSTED_SOURCES))
+
+@st.cache_resource
+def get_trusted_source_index():
+    """FAISS index over the trusted source embeddings (None without faiss)"""
+    verifier = get_verifier()
+    embeddings = get_trusted_source_embeddings()
+    if verifier is None or embeddings is None:
+        return None
+    return _load_layer("Trusted source index", lambda: verifier.build_source_index(embeddings))
+
+@st.cache_resource
+def get_summarizer():
+    return _load_layer("Summarizer", lambda: src.Summarizer(), uses_torch=True)
+
+@st.cache_resource
+def get_bias_analyzer():
+    return _load_layer("BiasSentimentAnalyzer", lambda: src.BiasSentimentAnalyzer(), uses_torch=True)
+
+class AnalysisLayers:
+    """
+    Attribute access to the cached analysis layers, e.g. `layers.classifier`.
+    Each layer is fetched from its cached getter on first access only, so a
+    scan never loads a model it doesn't touch.
+    """
+    _GETTERS = {
+        "preprocessor": get_preprocessor,
+        "linguistic_analyzer": get_linguistic_analyzer,
+        "scorer": get_scorer,
+        "source_verifier": get_source_verifier,
+        "entity_verifier": get_entity_verifier,
+        "classifier": get_classifier,
+        "verifier": get_verifier,
+        "trusted_source_embeddings": get_trusted_source_embeddings,
+        "trusted_source_index": get_trusted_source_index,
+        "summarizer": get_summarizer,
+        "bias_analyzer": get_bias_analyzer,
+    }
+
+    def __getattr__(self, name):
+        getter = self._GETTERS.get(name)
+        if getter is None:
+            raise AttributeError(name)
+        value = getter()
+        setattr(self, name, value)  # Later lookups skip __getattr__
+        return value
+
+@st.cache_resource
+def get_layer_pool():
+    """Worker threads shared by all scans in this process, reused across clicks"""
+    return ThreadPoolExecutor(max_workers=6, thread_name_prefix="analysis-layer")
+
+# Deep Scan layers, in the order the warmup loads them
+DEEP_LAYERS = ("preprocessor", "entity_verifier", "classifier", "bias_analyzer",
+               "verifier", "trusted_source_embeddings", "trusted_source_index", "summarizer")
+
+@st.cache_resource(show_spinner=False)
+def start_deep_warmup():
+    """
+    Load the Deep Scan models on a background thread, once per process.
+    A scan that needs a layer still loading waits on that getter's cache
+    entry instead of loading it a second time.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deep-warmup")
+    future = executor.submit(lambda: [AnalysisLayers._GETTERS[name]() for name in DEEP_LAYERS])
+    executor.shutdown(wait=False)
+    return future
+
+@st.cache_resource(show_spinner=False)
+def start_summarizer_preload():
+    """
+    Load the summarizer (the slowest model to build) on a background thread
+    as soon as the server process starts, ahead of any sign-in.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summarizer-preload")
+    future = executor.submit(get_summarizer)
+    executor.shutdown(wait=False)
+    return future
 
 # --- Initialize Cookie Manager ---
 cookie_manager = pyc.CookieManager()
@@ -137,31 +276,39 @@ cookie_manager = pyc.CookieManager()
 # --- Initialize Session State ---
 session_manager.init_session_state(cookie_manager)
 
-# Handle Navigation via Query Params (for HTML buttons)
-if "nav" in st.query_params:
-    if st.query_params["nav"] == "login":
-        session_manager.set_page("login")
-    elif st.query_params["nav"] == "signup":
-        session_manager.set_page("signup")
-    st.query_params.clear()
-    st.rerun()
-
 @st.cache_resource
 def get_auth_service():
     return authentication.Authentication()
 
 auth = get_auth_service()
 
+@st.cache_resource
+def get_db():
+    return MongoDBHandler()
+
 components.load_css()
-db = MongoDBHandler()
+db = get_db()
+
+if config.PRELOAD_SUMMARIZER:
+    start_summarizer_preload()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _user_history(user_id, _db, limit=50, before_ts=None, text_preview_len=None):
+    """Cached history lookup keyed on user, cursor and page shape.
+    `_db` is excluded from hashing. Cleared after each save."""
+    return _db.get_user_history(
+        user_id, limit=limit, before_ts=before_ts, text_preview_len=text_preview_len
+    ) or []
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _history_item(item_id, user_id, _db):
+    """Cached full record for an opened History row."""
+    return _db.get_history_item(item_id, user_id) or {}
 
 # --- Page Logic ---
 
-def landing_page():
-    render_navbar()
-    
-    # Hero Section
-    st.markdown("""
+# Static landing-page markup, built once at import
+_HERO_HTML = """
         <div style='text-align: center; padding: 100px 5% 60px 5%;' class='fade-in'>
             <h1 style='font-size: clamp(2.5rem, 6vw, 4.5rem); margin-bottom: 25px; line-height: 1.1; max-width: 1000px; margin-left: auto; margin-right: auto;'>
                 <span class='neon-text'>Don’t Get Fooled.</span><br>Verify Before You Share.
@@ -170,48 +317,58 @@ def landing_page():
                 Advanced AI-powered fact checking system designed for high-integrity news analysis and misinformation defense.
             </p>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+_FEATURE_CARD = "<div class='glass-card feature-box'><h3>{icon}</h3><b>{title}</b><p>{text}</p></div>"
+_FEATURES = (
+    ("⚡", "AI Fact Checking", "Real-time high-precision analysis of news articles and claims."),
+    ("📊", "Trust Scoring", "Multi-dimensional confidence index based on source credibility."),
+    ("📝", "Smart Summary", "concise insights and threat intelligence from complex articles."),
+    ("📸", "Deepfake Detection", "Advanced media forensics for image and video authenticity."),
+)
+# Spacer, heading and the whole 2x2 card grid (.feature-grid) as one markdown block
+_LANDING_FEATURES_HTML = (
+    "<br><br><br>"
+    "<h2 style='text-align: center; margin-bottom: 50px; font-size: 2.2rem;'>🛡️ Intelligence Suite</h2>"
+    "<div class='feature-grid'>"
+    + "".join(_FEATURE_CARD.format(icon=icon, title=title, text=text) for icon, title, text in _FEATURES)
+    + "</div>"
+)
+_LANDING_CTA_HTML = (
+    "<br><br><br>"
+    "<div style='text-align: center;' class='glass-card'>"
+    "<h3 style='margin-bottom: 20px;'>Secure Your Digital Newsfeed</h3>"
+    "</div>"
+)
+
+def landing_page():
+    render_navbar()
+    
+    # Hero Section
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        if st.button("Get Started — Free", key="hero_analyze", type="primary", use_container_width=True):
-            if session_manager.is_authenticated():
-                session_manager.set_page("dashboard")
-            else:
-                session_manager.set_page("signup")
-            st.rerun()
-        
-    st.markdown("<br><br><br>", unsafe_allow_html=True)
-
-    # Feature Highlights (Intelligence Suite)
-    st.markdown("<h2 style='text-align: center; margin-bottom: 50px; font-size: 2.2rem;'>🛡️ Intelligence Suite</h2>", unsafe_allow_html=True)
-    
-    # Larger Box Layout using 2x2 grid for better visibility as requested
-    row1_c1, row1_c2 = st.columns(2)
-    with row1_c1:
-        st.markdown("<div class='glass-card feature-box'><h3>⚡</h3><b>AI Fact Checking</b><p>Real-time high-precision analysis of news articles and claims.</p></div>", unsafe_allow_html=True)
-    with row1_c2:
-        st.markdown("<div class='glass-card feature-box'><h3>📊</h3><b>Trust Scoring</b><p>Multi-dimensional confidence index based on source credibility.</p></div>", unsafe_allow_html=True)
+        # Navigation buttons use on_click: the callback runs before the rerun,
+        # so the target page renders in one pass instead of two
+        st.button(
+            "Get Started — Free", key="hero_analyze", type="primary", use_container_width=True,
+            on_click=session_manager.set_page,
+            args=("dashboard" if session_manager.is_authenticated() else "signup",)
+        )
         
-    st.markdown("<br>", unsafe_allow_html=True)
-    
-    row2_c1, row2_c2 = st.columns(2)
-    with row2_c1:
-        st.markdown("<div class='glass-card feature-box'><h3>📝</h3><b>Smart Summary</b><p>concise insights and threat intelligence from complex articles.</p></div>", unsafe_allow_html=True)
-    with row2_c2:
-        st.markdown("<div class='glass-card feature-box'><h3>📸</h3><b>Deepfake Detection</b><p>Advanced media forensics for image and video authenticity.</p></div>", unsafe_allow_html=True)
+    # Feature Highlights (Intelligence Suite): larger boxes in a 2x2 grid for better visibility
+    st.markdown(_LANDING_FEATURES_HTML, unsafe_allow_html=True)
 
     # Registration CTA
     if not session_manager.is_authenticated():
-        st.markdown("<br><br><br>", unsafe_allow_html=True)
         col_left, col_mid, col_right = st.columns([1, 2, 1])
         with col_mid:
-            st.markdown("<div style='text-align: center;' class='glass-card'>", unsafe_allow_html=True)
-            st.markdown("<h3 style='margin-bottom: 20px;'>Secure Your Digital Newsfeed</h3>", unsafe_allow_html=True)
-            if st.button("Register Professional Account", key="cta_reg", use_container_width=True):
-                session_manager.set_page("signup")
-                st.rerun()
-            st.markdown("</div>", unsafe_allow_html=True)
+            # Each st.markdown is its own element, so the card can't wrap the button;
+            # the heading card is emitted whole instead of as open/close fragments
+            st.markdown(_LANDING_CTA_HTML, unsafe_allow_html=True)
+            st.button("Register Professional Account", key="cta_reg", use_container_width=True,
+                      on_click=session_manager.set_page, args=("signup",))
 
     # Professional Footer
     render_footer()
@@ -225,28 +382,11 @@ def login_page():
     
     # --- Column 1: Branding (Left Side) ---
     with col1:
-        import base64
-        import os
-        
-        logo_path = "assets/logo.png"
-        logo_html = ""
-        if os.path.exists(logo_path):
-             with open(logo_path, "rb") as f:
-                encoded = base64.b64encode(f.read()).decode()
-             logo_html = f'<img src="data:image/png;base64,{encoded}" style="width: 200px; margin-bottom: 25px;">'
-        else:
-             logo_html = '<div style="font-size: 100px;">🛡️</div>'
-
-        st.markdown(f"""
-            <div style='display: flex; flex-direction: column; justify-content: center; height: 100%; padding-right: 40px; border-right: 1px solid rgba(148, 163, 184, 0.1);'>
-                {logo_html}
-                <h1 style='font-size: 4rem; margin-bottom: 15px;'>Secure Access</h1>
-                <p style='color: #94A3B8; font-size: 1.5rem;'>
-                    Verify your identity to access <br>
-                    <span class='neon-text' style='font-weight: 600;'>SatyaSetu Dashboard</span>
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_branding_html(
+            title="Secure Access",
+            lead="Verify your identity to access",
+            highlight="SatyaSetu Dashboard",
+        ), unsafe_allow_html=True)
 
     # --- Column 2: Login Form (Right Side) ---
     with col2:
@@ -262,13 +402,14 @@ def login_page():
                     if success:
                         st.session_state.show_otp = True
                         st.session_state.pending_user = user
+                        # Sandbox preview code, looked up once per OTP step rather than every rerun
+                        st.session_state.dev_otp = auth.get_pending_otp(user['email']) if auth.mail.is_simulated else None
                         st.rerun()
                     else:
                         st.error(msg)
             
-            if st.button("New here? Create an account", use_container_width=True):
-                session_manager.set_page("signup")
-                st.rerun()
+            st.button("New here? Create an account", use_container_width=True,
+                      on_click=session_manager.set_page, args=("signup",))
         else:
             # OTP Step
             st.markdown(f"""
@@ -279,10 +420,9 @@ def login_page():
             """, unsafe_allow_html=True)
             
             # Sandbox Mode Preview
-            if auth.mail.is_simulated:
-                dev_otp = auth.get_pending_otp(st.session_state.pending_user['email'])
-                if dev_otp:
-                    st.info(f"🛠️ **Developer Sandbox**: Your code is `{dev_otp}`")
+            dev_otp = st.session_state.get("dev_otp")
+            if dev_otp:
+                st.info(f"🛠️ **Developer Sandbox**: Your code is `{dev_otp}`")
             
             with st.form("otp_form", border=True):
                 otp_code = st.text_input("Enter 6-digit Code", max_chars=6, placeholder="000000")
@@ -292,8 +432,11 @@ def login_page():
                     success, msg = auth.verify_otp(st.session_state.pending_user['email'], otp_code)
                     if success:
                         session_manager.login(st.session_state.pending_user, cookie_manager)
+                        # Models stream in while the user finds their way to a scan
+                        start_deep_warmup()
                         st.session_state.show_otp = False
                         st.session_state.pending_user = None
+                        st.session_state.dev_otp = None
                         
                         if st.session_state.get("pending_analysis"):
                             p = st.session_state.pending_analysis
@@ -308,6 +451,7 @@ def login_page():
             if st.button("← Back to Login", use_container_width=True):
                 st.session_state.show_otp = False
                 st.session_state.pending_user = None
+                st.session_state.dev_otp = None
                 st.rerun()
 
 def signup_page():
@@ -318,28 +462,11 @@ def signup_page():
     
     # --- Column 1: Branding (Left Side) ---
     with col1:
-        import base64
-        import os
-        
-        logo_path = "assets/logo.png"
-        logo_html = ""
-        if os.path.exists(logo_path):
-             with open(logo_path, "rb") as f:
-                encoded = base64.b64encode(f.read()).decode()
-             logo_html = f'<img src="data:image/png;base64,{encoded}" style="width: 200px; margin-bottom: 25px;">'
-        else:
-             logo_html = '<div style="font-size: 100px;">🛡️</div>'
-
-        st.markdown(f"""
-            <div style='display: flex; flex-direction: column; justify-content: center; height: 100%; padding-right: 40px; border-right: 1px solid rgba(148, 163, 184, 0.1);'>
-                {logo_html}
-                <h1 style='font-size: 4rem; margin-bottom: 15px;'>Join SatyaSetu</h1>
-                <p style='color: #94A3B8; font-size: 1.5rem;'>
-                    Create your professional account for <br>
-                    <span class='neon-text' style='font-weight: 600;'>Advanced News Verification</span>
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_branding_html(
+            title="Join SatyaSetu",
+            lead="Create your professional account for",
+            highlight="Advanced News Verification",
+        ), unsafe_allow_html=True)
 
     # --- Column 2: Signup Form (Right Side) ---
     with col2:
@@ -369,124 +496,239 @@ def signup_page():
                     else:
                         st.error(msg)
         
-        if st.button("Already have an account? Sign In", use_container_width=True):
-            session_manager.set_page("login")
-            st.rerun()
+        st.button("Already have an account? Sign In", use_container_width=True,
+                  on_click=session_manager.set_page, args=("login",))
 
+@st.fragment
 def render_result_card(nav_name):
-    """Standardized component to display analysis results if they exist for the current tab"""
+    """Standardized component to display analysis results if they exist for the current tab.
+    Runs as a fragment so report interactions don't rerun the page chrome."""
     result = session_manager.get_analysis_result()
     
     # Only show results if they match the current media type or if we just ran an analysis
     if result and result.get('source_type', '').lower() in nav_name.lower():
-        st.markdown("---")
-        st.markdown(f"### 📊 Verification Report: {result['score']['rating']}")
+        # Static report markup is emitted as one markdown block per container
+        st.markdown(f"---\n### 📊 Verification Report: {result['score']['rating']}")
         
         c1, c2 = st.columns([1, 2])
         with c1:
             components.credibility_gauge(result['score']['score'])
         with c2:
-            st.markdown("#### Detection Signal")
-            st.markdown(f"<h2 style='color: {result['score']['color']};'>{result['score']['rating']}</h2>", unsafe_allow_html=True)
-            st.code(f"Confidence: {result['deberta']['real_prob']*100:.1f}%", language=None)
+            st.markdown(
+                "#### Detection Signal\n"
+                f"<h2 style='color: {result['score']['color']};'>{result['score']['rating']}</h2>\n\n"
+                f"<pre><code>Confidence: {result['deberta']['real_prob']*100:.1f}%</code></pre>",
+                unsafe_allow_html=True
+            )
 
         with st.expander("🛡️ AI Security Audit & Reasons", expanded=True):
             st.markdown(f"**Summary:** {result['summary']}")
             if st.button("Clear Report", key=f"clear_report_{nav_name}"):
                 session_manager.clear_analysis_result()
-                st.rerun()
+                st.rerun(scope="fragment")
+
+        # Claim breakdown only renders while its expander is open
+        claims_panel = st.expander(
+            "🔍 Verified Claims Reference",
+            key=f"claims_open_{nav_name}",
+            on_change="rerun"
+        )
+        if claims_panel.open:
+            with claims_panel:
+                components.similarity_breakdown(result.get('claims'))
+
+# One-line partial result per layer, shown in the status feed as each completes
+_LAYER_DIGESTS = {
+    'linguistic': lambda r: f"Linguistic risk: {r.get('risk_score', 0):.0f}/100",
+    'deberta': lambda r: f"AI model verdict: {r.get('label')} ({r.get('confidence', 0)*100:.1f}%)",
+    'bias': lambda r: f"Sentiment: {r.get('sentiment', 'Neutral')}",
+    'entity': lambda r: f"Entities: {r.get('reason', '')}",
+    'source': lambda r: f"Source: {r.get('status', r.get('domain'))}",
+    'claims': lambda r: f"{len(r)} claim(s) cross-referenced",
+    'summary': lambda r: "Executive summary ready",
+}
+
+def _layer_digest(name, result):
+    try:
+        return _LAYER_DIGESTS[name](result)
+    except Exception:
+        return f"{name} complete"
+
+# Neutral stand-ins for scored layers that didn't run (or haven't finished yet)
+_LAYER_DEFAULTS = {
+    'linguistic': {"risk_score": 0, "linguistic_flags": []},
+    'deberta': {"label": "Neutral", "confidence": 0.5, "fake_prob": 0.5, "real_prob": 0.5},
+    'bias': {"risk_score": 0, "sentiment": "Neutral"},
+    'source': {"score": 50, "domain": "Unknown"},
+}
+
+def _fill_layer_defaults(layer_results, deep_scan):
+    """Scored layer results keyed as in the result bundle, defaults filled in"""
+    filled = {name: layer_results.get(name, default) for name, default in _LAYER_DEFAULTS.items()}
+    if deep_scan:
+        filled['entity'] = layer_results.get('entity', {"score": 50, "reason": "Entity Verifier skipped."})
+    else:
+        filled['entity'] = {"score": 60.0, "reason": "Entity verification available in Deep Scan."}
+    return filled
+
+def _credibility_score(scorer, filled):
+    if not scorer:
+        return {"score": 50, "rating": "Indeterminate", "color": "#94A3B8"}
+    return scorer.calculate_score(
+        ml_score=filled['deberta']['real_prob'] * 100,
+        keyword_risk_score=filled['linguistic']['risk_score'],
+        sentiment_risk_score=filled['bias']['risk_score'],
+        source_score=filled['source']['score'],
+        entity_score=filled['entity']['score']
+    )
+
+# Fallback outputs the model layers return instead of raising; never cached
+_LAYER_FAILED = {
+    'deberta': lambda r: r.get('label') == "Error",
+    'bias': lambda r: 'sentiment_intensity' not in r,  # sentiment pipeline didn't run
+    'summary': lambda r: r in ("Summary unavailable.", "Error generating summary."),
+}
+
+class _LayerFallback(Exception):
+    """Carries a layer's fallback output past st.cache_data, which doesn't store raised calls"""
+    def __init__(self, result):
+        super().__init__("layer returned a fallback result")
+        self.result = result
+
+@st.cache_data(max_entries=256, ttl=3600, show_spinner=False)
+def _cached_layer_result(layer, text, _analyze):
+    """
+    Output of a model layer that depends only on the cleaned text, shared
+    across sessions. `layer` keys the entry; `_analyze` is excluded from hashing.
+    """
+    result = _analyze(text)
+    if _LAYER_FAILED[layer](result):
+        raise _LayerFallback(result)
+    return result
+
+def _text_layer_result(layer, text, _analyze):
+    """Cached layer output; a transient failure is used for this scan only"""
+    try:
+        return _cached_layer_result(layer, text, _analyze)
+    except _LayerFallback as e:
+        logger.warning(f"{layer} layer fell back for this scan; not caching it")
+        return e.result
 
 def run_full_analysis(input_text, source_type="Text", source_url=None, deep_scan=False):
     """Core Analysis Pipeline Runner with Dual-Track Feedback"""
-    import logging
-    logger = logging.getLogger(__name__)
+    # One wall-clock read for the report; layer timings are monotonic offsets from t0
+    wall0 = datetime.now()
+    t0 = time.perf_counter_ns()
     try:
         # 1. Initialize Status Tracking
         status_label = "Deep AI Verification" if deep_scan else "Fast Heuristic Scan"
         status = st.status(f"🚀 Initializing {source_type} {status_label}...", expanded=True)
         
+        # Progress goes to the status label or plain st.text lines; markdown
+        # writes re-render through the markdown pipeline on every delta.
         with status:
-            st.write("🔧 Loading Core Infrastructure...")
-            components_ai = load_fast_components()
-            
-            if deep_scan:
-                st.write("🧠 Waking up Deep AI Models... (May take a moment)")
-                deep_comps = load_deep_components()
-                components_ai.update(deep_comps)
+            layers = AnalysisLayers()
+            preprocessor = layers.preprocessor
+            # Image/Video scans run on a generated description, so claim
+            # cross-referencing and summarization add nothing there.
+            is_text_scan = source_type == "Text"
             
             user = session_manager.get_current_user()
             
-            st.write("📑 Layer 1: Normalizing Content...")
-            preprocessor = components_ai.get('preprocessor')
+            status.update(label=f"📑 {source_type} {status_label}: normalizing content...")
             clean_text = preprocessor.clean_text(input_text) if preprocessor else input_text.strip()
+            # Identical content + scan settings reuse the session's previous report
+            cache_key = (
+                hashlib.blake2b(clean_text.encode("utf-8"), digest_size=16).hexdigest(),
+                source_type, source_url, deep_scan
+            )
+            cached = session_manager.get_cached_result(cache_key)
+            if cached:
+                st.text("♻️ Identical content already verified, reusing the report")
+                result_bundle = {**cached, "timestamp": wall0}
+            else:
+                urls, claims, entities = [], [], []
+                if preprocessor and deep_scan:
+                    # One spaCy parse serves both the entity and claim layers
+                    urls, claims, entities = preprocessor.extract_all(input_text, cleaned=clean_text)
+                    if not is_text_scan:
+                        claims = []
+                elif preprocessor:
+                    urls = preprocessor.extract_urls(input_text)
+                target_url = source_url if source_url else (urls[0] if urls else None)
             
-            st.write("🚩 Layer 2: Scanning Linguistic Patterns...")
-            linguistic_analyzer = components_ai.get('linguistic_analyzer')
-            ling_res = linguistic_analyzer.analyze(clean_text) if linguistic_analyzer else {"risk_score": 0, "linguistic_flags": []}
-            
-            # AI Track (Layer 3)
-            deberta_res = {"label": "Neutral", "confidence": 0.5, "fake_prob": 0.5, "real_prob": 0.5}
-            if deep_scan and components_ai.get('classifier'):
-                st.write("🤖 Layer 3: Deep Learning AI Evaluation...")
-                deberta_res = components_ai['classifier'].predict(clean_text)
-            
-            # AI Track (Layer 4)
-            bias_res = {"risk_score": 0, "sentiment": "Neutral"}
-            if deep_scan and components_ai.get('bias_analyzer'):
-                st.write("⚖️ Layer 4: Emotional & Bias Audit...")
-                bias_res = components_ai['bias_analyzer'].analyze(clean_text)
-            
-            # Layer 5: Personality & Entity Check (Deep only)
-            entity_res = {"score": 60.0, "reason": "Entity verification available in Deep Scan."}
-            if deep_scan:
-                st.write("🔍 Layer 5: Personality & Entity Check...")
-                entity_verifier = components_ai.get('entity_verifier')
-                entities = preprocessor.get_entities(clean_text) if preprocessor else []
-                entity_res = entity_verifier.verify_entities(entities) if entity_verifier else {"score": 50, "reason": "Entity Verifier skipped."}
+                if deep_scan:
+                    status.update(label=f"🧠 {source_type} {status_label}: waking up deep AI models (may take a moment)...")
+                # Resolve cached layers on the script thread; workers only run the analyzers
+                linguistic_analyzer = layers.linguistic_analyzer
+                source_verifier = layers.source_verifier
+                classifier = layers.classifier if deep_scan else None
+                bias_analyzer = layers.bias_analyzer if deep_scan else None
+                entity_verifier = layers.entity_verifier if deep_scan else None
+                verifier = layers.verifier if claims else None
+                source_embeddings = layers.trusted_source_embeddings if verifier else None
+                source_index = layers.trusted_source_index if verifier else None
+                summarizer = layers.summarizer if deep_scan and is_text_scan else None
             
-            st.write("🌐 Layer 6: Source & Domain Audit...")
-            source_verifier = components_ai.get('source_verifier')
-            urls = preprocessor.extract_urls(input_text) if preprocessor else []
-            target_url = source_url if source_url else (urls[0] if urls else None)
-            source_res = source_verifier.verify_source(target_url) if source_verifier else {"score": 50, "domain": "Unknown"}
-
-            # AI Track (Layer 6.5)
-            verification_res = []
-            if deep_scan and components_ai.get('verifier'):
-                st.write("🛡️ Layer 6.5: Trusted Source Cross-Ref...")
-                claims = preprocessor.extract_claims(clean_text) if preprocessor else []
-                verification_res = components_ai['verifier'].verify_claims(claims, ["Official records and news confirm recent reports."])
+                # Layers 2-7 are independent once the text is normalized, so they run
+                # concurrently and the scan takes roughly as long as the slowest layer.
+                executor = get_layer_pool()
+                jobs = {}
+                if linguistic_analyzer:
+                    jobs['linguistic'] = executor.submit(linguistic_analyzer.analyze, clean_text)
+                if classifier:
+                    jobs['deberta'] = executor.submit(_text_layer_result, 'deberta', clean_text, classifier.predict)
+                if bias_analyzer:
+                    jobs['bias'] = executor.submit(_text_layer_result, 'bias', clean_text, bias_analyzer.analyze)
+                if entity_verifier:
+                    jobs['entity'] = executor.submit(entity_verifier.verify_entities, entities)
+                if source_verifier:
+                    jobs['source'] = executor.submit(source_verifier.verify_source, target_url)
+                if verifier:
+                    jobs['claims'] = executor.submit(verifier.verify_claims_precomputed, claims, TRUSTED_SOURCES, source_embeddings, source_index)
+                if summarizer:
+                    jobs['summary'] = executor.submit(_text_layer_result, 'summary', clean_text, summarizer.generate_summary)
+                
+                status.update(label=f"🚀 {source_type} {status_label}: running {len(jobs)} layers...")
+                # Report each layer as it finishes rather than after the slowest one,
+                # with a provisional score from the layers that are in so far
+                scorer = layers.scorer
+                provisional = st.empty()
+                layer_results = {}
+                layer_ms = {}
+                job_names = {job: name for name, job in jobs.items()}
+                for job in as_completed(job_names):
+                    name = job_names[job]
+                    layer_results[name] = job.result()
+                    layer_ms[name] = (time.perf_counter_ns() - t0) // 1_000_000
+                    st.text(f"✅ {_layer_digest(name, layer_results[name])} ({layer_ms[name]} ms)")
+                    partial = _credibility_score(scorer, _fill_layer_defaults(layer_results, deep_scan))
+                    provisional.text(
+                        f"📈 Provisional credibility: {partial['score']:.0f}/100 ({partial['rating']}), "
+                        f"{len(layer_results)}/{len(jobs)} layers in"
+                    )
+                    status.update(label=f"🚀 {source_type} {status_label}: {len(layer_results)}/{len(jobs)} layers done...")
             
-            # AI Track (Layer 7)
-            summary = "Summary available in Deep Scan Mode."
-            if deep_scan and components_ai.get('summarizer'):
-                st.write("📝 Layer 7: Generating Executive Summary...")
-                summary = components_ai['summarizer'].generate_summary(clean_text)
+                filled = _fill_layer_defaults(layer_results, deep_scan)
+                verification_res = layer_results.get('claims', [])
+                default_summary = "Summary available in Deep Scan Mode." if is_text_scan else "Summary not applicable to media scans."
+                summary = layer_results.get('summary', default_summary)
             
-            st.write("⚖️ Compiling Weighted Credibility Report...")
-            scorer = components_ai.get('scorer')
-            final_score = scorer.calculate_score(
-                ml_score=deberta_res['real_prob'] * 100,
-                keyword_risk_score=ling_res['risk_score'],
-                sentiment_risk_score=bias_res['risk_score'],
-                source_score=source_res['score'],
-                entity_score=entity_res['score']
-            ) if scorer else {"score": 50, "rating": "Indeterminate", "color": "#94A3B8"}
+                status.update(label=f"⚖️ {source_type} {status_label}: compiling credibility report...")
+                final_score = _credibility_score(scorer, filled)
             
-            result_bundle = {
-                "text": clean_text[:200] + "...",
-                "full_text": clean_text,
-                "score": final_score,
-                "deberta": deberta_res,
-                "bias": bias_res,
-                "linguistic": ling_res,
-                "source": source_res,
-                "entity": entity_res,
-                "summary": summary,
-                "claims": verification_res,
-                "timestamp": datetime.now(),
-                "source_type": source_type
-            }
+                result_bundle = {
+                    "text": clean_text[:200] + "...",
+                    "full_text": clean_text,
+                    "score": final_score,
+                    **filled,
+                    "summary": summary,
+                    "claims": verification_res,
+                    "timestamp": wall0,
+                    "timings_ms": layer_ms,
+                    "source_type": source_type
+                }
+                session_manager.cache_result(cache_key, result_bundle)
             
             session_manager.save_analysis_result(result_bundle)
             
@@ -494,17 +736,22 @@ def run_full_analysis(input_text, source_type="Text", source_url=None, deep_scan
                 db_record = {
                     "user_id": user['id'],
                     "article_text": clean_text,
-                    "credibility_score": final_score['score'],
-                    "classification": final_score['rating'],
-                    "bias_sentiment": bias_res,
-                    "summary": summary,
-                    "source_type": source_type
+                    "credibility_score": result_bundle['score']['score'],
+                    "classification": result_bundle['score']['rating'],
+                    "bias_sentiment": result_bundle['bias'],
+                    "summary": result_bundle['summary'],
+                    "source_type": source_type,
+                    "timestamp": datetime.utcnow()
                 }
-                db.save_analysis(db_record)
+                # Batched write-behind off the critical path; the handler mutates the
+                # record, so it gets its own copy. Cached history is dropped only once
+                # the new record is actually readable.
+                db.queue_analysis(dict(db_record), on_saved=_user_history.clear)
+                session_manager.push_recent_history(db_record)
             
             status.update(label=f"✅ {status_label} Complete!", state="complete", expanded=False)
             st.session_state.pending_analysis = None
-            st.rerun()
+            # No rerun needed: callers render the saved result after this returns
             return result_bundle
             
     except Exception as e:
@@ -528,13 +775,17 @@ def show_overview_page(user, db):
         st.metric("Threats Detected", "12", delta="-4", delta_color="inverse")
     
     st.markdown("### Recent Activity")
-    history = db.get_user_history(user['id']) or []
+    history = session_manager.get_recent_history()
+    if history is None:
+        session_manager.set_recent_history(_user_history(user['id'], db))
+        history = session_manager.get_recent_history()
     if history:
         for item in history[:3]:
-            st.markdown(f"<div class='glass-card' style='margin-bottom: 10px; padding: 10px;'><b>{item.get('classification')}</b> - {item.get('source_type')} - {item.get('timestamp')}</div>", unsafe_allow_html=True)
+            st.markdown(f"<div class='glass-card' style='margin-bottom: 10px; padding: 10px;'><b>{item['classification']}</b> - {item['source_type']} - {item['timestamp']}</div>", unsafe_allow_html=True)
     else:
         st.info("No recent activity found.")
 
+@st.fragment
 def show_text_analysis_page():
     """Render text verification tool"""
     st.markdown("## 📄 Text Verification")
@@ -568,6 +819,7 @@ def show_text_analysis_page():
         # PERSISTENT RESULT DISPLAY
         render_result_card("Text Analysis")
 
+@st.fragment
 def show_image_analysis_page():
     """Render forensic image tool"""
     st.markdown("## 🖼️ Forensic Image Analysis")
@@ -604,6 +856,7 @@ def show_image_analysis_page():
         # PERSISTENT RESULT DISPLAY
         render_result_card("Image Analysis")
 
+@st.fragment
 def show_video_analysis_page():
     """Render video verification tool"""
     st.markdown("## 🎥 Video Deepfake Guard")
@@ -660,44 +913,97 @@ def show_settings_page(user):
         </div>
     """, unsafe_allow_html=True)
 
+HISTORY_PAGE_SIZE = 20
+
+def _set_history_cursors(cursors):
+    st.session_state.history_cursors = cursors
+
 def show_history_page(user, db):
-    """Render analysis history"""
+    """Render analysis history, one page at a time"""
+    if not user:
+        # Nothing below is safe without a user id; skip the DB and widget work
+        return
     st.markdown("### Analysis History")
-    history = db.get_user_history(user['id'])
+    # Keyset pagination: each page starts below the oldest timestamp of the previous one
+    cursors = st.session_state.get("history_cursors") or [None]
+    # Fetch one extra row to know whether a next page exists
+    rows = _user_history(
+        user['id'], db,
+        limit=HISTORY_PAGE_SIZE + 1,
+        before_ts=cursors[-1],
+        text_preview_len=100
+    )
+    history = rows[:HISTORY_PAGE_SIZE]
+    has_next = len(rows) > HISTORY_PAGE_SIZE
     
     if not history:
         st.info("No history found.")
     else:
-        for item in history:
-            with st.expander(f"{item.get('timestamp')} - {item.get('classification')} ({item.get('credibility_score')}%)"):
-                st.write(item.get('summary', 'No summary'))
-                st.caption(f"Text Preview: {item.get('article_text')[:100]}...")
+        # One table element for the whole page; only the selected row gets a detail view
+        table = st.dataframe(
+            [
+                {
+                    "Timestamp": str(item.get('timestamp')),
+                    "Verdict": item.get('classification'),
+                    "Score (%)": item.get('credibility_score'),
+                    "Source": item.get('source_type'),
+                    "Preview": item.get('article_text_preview', ''),
+                }
+                for item in history
+            ],
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"history_table_{len(cursors)}"
+        )
+        # Newest entry is shown until a row is picked
+        selected = table.selection.rows
+        item = history[selected[0] if selected else 0]
+        # Heavy fields come from a per-item lookup, only for the shown row
+        detail = _history_item(item.get('_id'), user['id'], db)
+        st.markdown(f"#### {item.get('classification')} ({item.get('credibility_score')}%)")
+        # Raw article text: render as plain text, not markdown
+        st.text(f"{item.get('timestamp')}")
+        st.text(detail.get('summary', 'No summary'))
+        st.text(f"Text Preview: {item.get('article_text_preview', '')}...")
+
+    if len(cursors) > 1 or has_next:
+        c_prev, c_next = st.columns(2)
+        with c_prev:
+            st.button("← Prev", disabled=len(cursors) == 1, use_container_width=True, key="history_prev",
+                      on_click=_set_history_cursors, args=(cursors[:-1],))
+        with c_next:
+            st.button("Next →", disabled=not has_next, use_container_width=True, key="history_next",
+                      on_click=_set_history_cursors,
+                      args=(cursors + [history[-1].get('timestamp')] if has_next else cursors,))
+
+# Sidebar label -> section renderer; dict order is the radio order
+_DASHBOARD_SECTIONS = {
+    "🏠 Dashboard Overview": lambda user, db: show_overview_page(user, db),
+    "📄 Text Analysis": lambda user, db: show_text_analysis_page(),
+    "🖼️ Image Analysis": lambda user, db: show_image_analysis_page(),
+    "🎥 Video Analysis": lambda user, db: show_video_analysis_page(),
+    "📜 History": lambda user, db: show_history_page(user, db),
+    "⚙️ Settings": lambda user, db: show_settings_page(user),
+}
 
 def dashboard_page():
     """Main dashboard entry point with sidebar navigation"""
     user = session_manager.get_current_user()
     if not user:
+        # Redirect in place rather than paying for a second full run
         session_manager.set_page("login")
-        st.rerun()
-        return
+        return login_page()
 
     # Sidebar Navigation - High Priority Isolation
     with st.sidebar:
-        st.markdown(f"### <span class='neon-text'>SatyaSetu</span> AI", unsafe_allow_html=True)
-        st.markdown(f"**Welcome, {user['name']}**")
-        st.markdown("---")
-        
-        # Use a literal list for navigation to ensure strict mapping
-        nav_options = [
-            "🏠 Dashboard Overview",
-            "📄 Text Analysis",
-            "🖼️ Image Analysis",
-            "🎥 Video Analysis",
-            "📜 History",
-            "⚙️ Settings"
-        ]
+        st.markdown(
+            f"### <span class='neon-text'>SatyaSetu</span> AI\n\n**Welcome, {user['name']}**\n\n---",
+            unsafe_allow_html=True
+        )
         
-        nav = st.radio("Navigation", nav_options, key="sidebar_nav_radio")
+        nav = st.radio("Navigation", list(_DASHBOARD_SECTIONS), key="sidebar_nav_radio")
         
         st.markdown("---")
         if st.button("Logout", use_container_width=True, key="logout_btn"):
@@ -709,40 +1015,28 @@ def dashboard_page():
     main_content = st.container()
     
     with main_content:
-        # Strict Conditional Rendering Pattern
-        if nav == "🏠 Dashboard Overview":
-            show_overview_page(user, db)
-            
-        elif nav == "📄 Text Analysis":
-            show_text_analysis_page()
-            
-        elif nav == "🖼️ Image Analysis":
-            show_image_analysis_page()
-            
-        elif nav == "🎥 Video Analysis":
-            show_video_analysis_page()
-            
-        elif nav == "📜 History":
-            show_history_page(user, db)
-            
-        elif nav == "⚙️ Settings":
-            show_settings_page(user)
+        _DASHBOARD_SECTIONS.get(nav, _DASHBOARD_SECTIONS["🏠 Dashboard Overview"])(user, db)
 
 # --- Main Routing Controller ---
+PAGES = {
+    "landing": landing_page,
+    "login": login_page,
+    "signup": signup_page,
+    "dashboard": dashboard_page,
+}
+
+# Pages the HTML navbar links may request via ?nav=
+_NAV_QUERY_PAGES = {"login", "signup"}
+
 def main():
     """Application Router"""
+    # Navigation via query params (for HTML buttons) routes in this same run
+    if "nav" in st.query_params:
+        if st.query_params["nav"] in _NAV_QUERY_PAGES:
+            session_manager.set_page(st.query_params["nav"])
+        st.query_params.clear()
     page = st.session_state.get("page", "landing")
-
-    if page == "landing":
-        landing_page()
-    elif page == "login":
-        login_page()
-    elif page == "signup":
-        signup_page()
-    elif page == "dashboard":
-        dashboard_page()
-    else:
-        landing_page()
+    PAGES.get(page, landing_page)()
 
 if __name__ == "__main__":
     main()
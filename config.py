@@ -4,6 +4,7 @@ Central configuration for the application
 """
 
 import os
+import secrets
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -24,6 +25,21 @@ MODEL_CACHE_DIR = os.getenv("MODEL_CACHE_DIR", "./models")
 DEBERTA_MODEL_NAME = "distilbert-base-uncased" # Lighter than DeBERTa-v3
 SBERT_MODEL_NAME = "sentence-transformers/paraphrase-MiniLM-L3-v2" # Ultra-light
 SPACY_MODEL = "en_core_web_sm"
+# CPU models are int8-quantized after loading; set VERISENSE_FP32=1 to keep full precision
+FORCE_FP32 = os.getenv("VERISENSE_FP32", "0") == "1"
+# Intra-op threads for CPU inference; layers already run side by side on the layer pool,
+# so each model using every core would oversubscribe the CPU
+TORCH_NUM_THREADS = int(os.getenv("TORCH_NUM_THREADS", "4"))
+# Summarizer beam width; greedy (1) costs a quarter of the checkpoint's default 4 beams
+SUMMARY_NUM_BEAMS = int(os.getenv("SUMMARY_NUM_BEAMS", "1"))
+# torch.compile the PyTorch summarizer at load (slower start, faster generate); off by default
+SUMMARY_TORCH_COMPILE = os.getenv("VERISENSE_TORCH_COMPILE", "0") == "1"
+# Articles over this many words get an extractive (LexRank) summary instead of the model;
+# VERISENSE_FAST_SUMMARY=1 uses it for every article
+SUMMARY_EXTRACTIVE_MIN_WORDS = int(os.getenv("SUMMARY_EXTRACTIVE_MIN_WORDS", "800"))
+FAST_SUMMARY = os.getenv("VERISENSE_FAST_SUMMARY", "0") == "1"
+# Start loading the summarizer when the server boots instead of on the first Deep Scan
+PRELOAD_SUMMARIZER = os.getenv("VERISENSE_PRELOAD_SUMMARIZER", "1") == "1"
 
 # Credibility Scoring Weights
 WEIGHTS = {
@@ -62,12 +78,22 @@ COLORS = {
     "glow": "0 0 20px rgba(20, 184, 166, 0.4)",
     "gradient": "linear-gradient(135deg, #0F172A 0%, #111827 100%)"
 }
+# Render the credibility gauge as an interactive Plotly chart instead of inline SVG
+PLOTLY_GAUGE = os.getenv("VERISENSE_PLOTLY_GAUGE", "0") == "1"
 
 # API Timeouts
 REQUEST_TIMEOUT = 10  # seconds
 
 # Session Configuration
 SESSION_TIMEOUT = 3600  # 1 hour in seconds
+# bcrypt work factor for new password hashes (each +1 doubles hashing time)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Signs the remember-me cookie; without it a per-process key is used and cookies end at restart
+SESSION_SECRET = os.getenv("SESSION_SECRET") or secrets.token_hex(32)
+if SESSION_SECRET == "change_me_to_a_long_random_string":
+    # The old .env.example value is public; signing with it lets anyone forge a login cookie
+    raise RuntimeError("SESSION_SECRET is the example placeholder; set a random value or leave it blank")
+SESSION_COOKIE_MAX_AGE = 30 * 24 * 3600  # 30 days in seconds
 
 # Debug Mode
 DEBUG_MODE = os.getenv("DEBUG_MODE", "False") == "True"
@@ -0,0 +1,34 @@
+"""
+SatyaSetu analysis package.
+
+Analyzer classes are exported lazily (PEP 562) so that importing ``src``
+does not pull spaCy / transformers into the process until a layer is
+actually requested.
+"""
+
+import importlib
+
+_LAZY_EXPORTS = {
+    "TextPreprocessor": ".preprocessing",
+    "LinguisticAnalyzer": ".linguistic_analysis",
+    "CredibilityScorer": ".credibility_scorer",
+    "SourceVerifier": ".source_verifier",
+    "EntityVerifier": ".entity_verifier",
+    "Summarizer": ".summarizer",
+    "BiasSentimentAnalyzer": ".bias_sentiment_analyzer",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ is skipped next time
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
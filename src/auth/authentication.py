@@ -3,29 +3,45 @@ Authentication Module for VeriSense
 Handles user registration, login, and password hashing
 """
 
-import bcrypt
 import re
 import random
-import time
+import threading
+from functools import lru_cache
 from typing import Optional, Tuple
-from email_validator import validate_email, EmailNotValidError
+from cachetools import TTLCache
+from pymongo.errors import DuplicateKeyError
+import config
 from src.integrations.mongodb_handler import MongoDBHandler
 from src.utils.mail_handler import MailHandler
 
+# Password strength rules, compiled once
+_PWD_UPPER = re.compile(r"[A-Z]")
+_PWD_LOWER = re.compile(r"[a-z]")
+_PWD_DIGIT = re.compile(r"\d")
+
+@lru_cache(maxsize=1024)
+def _validate_email(email: str) -> Tuple[bool, str]:
+    """Validate and normalize email; memoized since every form rerun re-checks the same input"""
+    # Deferred: email_validator (and dnspython under it) isn't needed until a form is submitted
+    from email_validator import validate_email, EmailNotValidError
+    try:
+        valid = validate_email(email)
+        return True, valid.email
+    except EmailNotValidError as e:
+        return False, str(e)
+
 class Authentication:
     def __init__(self):
         self.db = MongoDBHandler()
         self.mail = MailHandler()
-        self.pending_otps = {} # {email: {"code": "123456", "expires": timestamp}}
+        # {email: {"code": "123456"}}; entries evict themselves after 5 minutes.
+        # TTLCache isn't thread-safe and this service is shared across sessions.
+        self.pending_otps = TTLCache(maxsize=10000, ttl=300)
+        self._otp_lock = threading.RLock()
     
     def validate_email_format(self, email: str) -> Tuple[bool, str]:
         """Validate email format"""
-        try:
-            # Validate and normalize email
-            valid = validate_email(email)
-            return True, valid.email
-        except EmailNotValidError as e:
-            return False, str(e)
+        return _validate_email(email)
     
     def validate_password_strength(self, password: str) -> Tuple[bool, str]:
         """
@@ -35,29 +51,28 @@ class Authentication:
         if len(password) < 8:
             return False, "Password must be at least 8 characters long"
         
-        if not re.search(r"[A-Z]", password):
+        if not _PWD_UPPER.search(password):
             return False, "Password must contain at least one uppercase letter"
         
-        if not re.search(r"[a-z]", password):
+        if not _PWD_LOWER.search(password):
             return False, "Password must contain at least one lowercase letter"
         
-        if not re.search(r"\d", password):
+        if not _PWD_DIGIT.search(password):
             return False, "Password must contain at least one number"
         
         return True, "Password is strong"
     
     def hash_password(self, password: str) -> str:
         """Hash password using bcrypt"""
-        salt = bcrypt.gensalt()
+        import bcrypt
+        salt = bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
     
     def verify_password(self, password: str, hashed_password: str) -> bool:
         """Verify password against hash"""
-        return bcrypt.checkpw(
-            password.encode('utf-8'),
-            hashed_password.encode('utf-8')
-        )
+        import bcrypt
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
     
     def register_user(self, name: str, email: str, password: str, confirm_password: str) -> Tuple[bool, str]:
         """
@@ -84,10 +99,6 @@ class Authentication:
         if not pwd_valid:
             return False, pwd_message
         
-        # Check if user already exists
-        if self.db.get_user_by_email(email):
-            return False, "Email already registered"
-        
         # Hash password
         password_hash = self.hash_password(password)
         
@@ -98,7 +109,11 @@ class Authentication:
             "password_hash": password_hash
         }
         
-        success = self.db.create_user(user_data)
+        # Duplicate emails are rejected by the insert itself (unique index)
+        try:
+            success = self.db.create_user(user_data)
+        except DuplicateKeyError:
+            return False, "Email already registered"
         
         if success:
             return True, "Account created successfully"
@@ -143,31 +158,26 @@ class Authentication:
     def generate_otp(self, email: str) -> str:
         """Generate a 6-digit OTP valid for 5 minutes"""
         otp = f"{random.randint(100000, 999999)}"
-        self.pending_otps[email] = {
-            "code": otp,
-            "expires": time.time() + 300 # 5 minutes
-        }
+        with self._otp_lock:
+            self.pending_otps[email] = {"code": otp}
         return otp
 
     def verify_otp(self, email: str, code: str) -> Tuple[bool, str]:
         """Verify the 6-digit code"""
-        if email not in self.pending_otps:
-            return False, "OTP not found for this email"
-        
-        data = self.pending_otps[email]
-        if time.time() > data["expires"]:
-            del self.pending_otps[email]
-            return False, "OTP has expired"
-        
-        if data["code"] != code:
-            return False, "Invalid verification code"
-        
-        # Success
-        del self.pending_otps[email]
+        with self._otp_lock:
+            data = self.pending_otps.get(email)
+            if data is None:
+                return False, "OTP not found or expired for this email"
+            
+            if data["code"] != code:
+                return False, "Invalid verification code"
+            
+            # Success
+            self.pending_otps.pop(email, None)
         return True, "Verification successful"
 
     def get_pending_otp(self, email: str) -> Optional[str]:
         """Get the pending OTP for UI preview (Sandbox Mode only)"""
-        if email in self.pending_otps:
-            return self.pending_otps[email]["code"]
-        return None
+        with self._otp_lock:
+            data = self.pending_otps.get(email)
+        return data["code"] if data else None
@@ -3,9 +3,39 @@ Session Manager for VeriSense
 Manages Streamlit session state for user authentication
 """
 
+import hashlib
+import hmac
+import pickle
+import time
 import streamlit as st
 from datetime import datetime, timedelta
+from collections import OrderedDict
 from typing import Optional
+import config
+from src.integrations.mongodb_handler import MongoDBHandler
+
+def _token_signature(payload: str) -> str:
+    return hmac.new(config.SESSION_SECRET.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256).hexdigest()
+
+def make_session_token(user_id: str) -> str:
+    """Signed, expiring remember-me token of the form <user id>.<expiry epoch>.<hmac>"""
+    payload = f"{user_id}.{int(time.time()) + config.SESSION_COOKIE_MAX_AGE}"
+    return f"{payload}.{_token_signature(payload)}"
+
+def read_session_token(token: str) -> Optional[str]:
+    """Return the user id from a valid, unexpired token, else None (no DB access)"""
+    try:
+        user_id, expires, signature = str(token).rsplit(".", 2)
+        expires_at = int(expires)
+    except ValueError:
+        return None
+    # Compared as bytes: compare_digest raises TypeError on non-ASCII str input
+    expected = _token_signature(f"{user_id}.{expires}")
+    if not hmac.compare_digest(signature.encode("utf-8"), expected.encode("utf-8")):
+        return None
+    if expires_at < time.time():
+        return None
+    return user_id
 
 def init_session_state(cookie_manager=None):
     """Initialize session state variables and handle auto-login from cookies"""
@@ -23,6 +53,8 @@ def init_session_state(cookie_manager=None):
     
     if "analysis_result" not in st.session_state:
         st.session_state.analysis_result = None
+    if "result_cache" not in st.session_state:
+        st.session_state.result_cache = OrderedDict() # LRU of (report bundle, size) by content key
 
     if "show_otp" not in st.session_state:
         st.session_state.show_otp = False
@@ -33,18 +65,24 @@ def init_session_state(cookie_manager=None):
     if "pending_analysis" not in st.session_state:
         st.session_state.pending_analysis = None
         
+    if "recent_history" not in st.session_state:
+        st.session_state.recent_history = None
+        
+    if "history_cursors" not in st.session_state:
+        st.session_state.history_cursors = [None] # Stack of page-start cursors (oldest timestamp seen)
+        
     if "logout_triggered" not in st.session_state:
         st.session_state.logout_triggered = False
 
     # Handle Auto-Login from Cookies (if not currently logging out)
     if cookie_manager and not st.session_state.authenticated and not st.session_state.logout_triggered:
         token = cookie_manager.get("satya_session_token")
-        if token:
+        # Forged, expired or legacy (bare user id) cookies are rejected before touching the DB
+        user_id = read_session_token(token) if token else None
+        if user_id:
             try:
-                from src.integrations.mongodb_handler import MongoDBHandler
                 db = MongoDBHandler()
-                # Find user by session token or ID stored in token
-                user = db.get_user_by_id(token) # Simplified: token is user ID for now
+                user = db.get_user_by_id(user_id)
                 if user:
                     user_data = {
                         "id": str(user["_id"]),
@@ -75,15 +113,19 @@ def login(user_data: dict, cookie_manager=None):
     st.session_state.logout_triggered = False
 
     if cookie_manager:
-        # Set persistent session cookie (30 days)
-        cookie_manager.set("satya_session_token", user_data['id'], key="set_login_cookie")
+        # Set persistent session cookie (30 days); the token carries its own signed expiry
+        cookie_manager.set(
+            "satya_session_token", make_session_token(user_data['id']), key="set_login_cookie",
+            expires_at=datetime.now() + timedelta(seconds=config.SESSION_COOKIE_MAX_AGE)
+        )
 
 def logout(cookie_manager=None):
     """Log out the current user and clear cookies"""
     st.session_state.authenticated = False
     st.session_state.user = None
     st.session_state.login_time = None
-    st.session_state.analysis_result = None
+    reset_heavy_state()
+    st.session_state.history_cursors = [None]
     st.session_state.page = "landing"
     
     st.session_state.logout_triggered = True
@@ -125,6 +167,65 @@ def get_analysis_result() -> Optional[dict]:
     """Get saved analysis result"""
     return st.session_state.get("analysis_result", None)
 
+# Session state lives until the session is dropped, so per-session caches stay bounded
+RESULT_CACHE_MAX_ITEMS = 32
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+def get_cached_result(key) -> Optional[dict]:
+    """Look up a previous report for identical input, marking it recently used"""
+    cache = st.session_state.get("result_cache")
+    if not cache or key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key][0]
+
+def cache_result(key, result: dict):
+    """
+    Remember a report bundle, evicting least recently used entries beyond
+    RESULT_CACHE_MAX_ITEMS or RESULT_CACHE_MAX_BYTES (pickled size).
+    """
+    try:
+        size = len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return # Unpicklable bundles aren't worth caching
+    if size > RESULT_CACHE_MAX_BYTES:
+        return
+    cache = st.session_state.setdefault("result_cache", OrderedDict())
+    cache[key] = (result, size)
+    cache.move_to_end(key)
+    total = sum(entry_size for _, entry_size in cache.values())
+    while len(cache) > RESULT_CACHE_MAX_ITEMS or total > RESULT_CACHE_MAX_BYTES:
+        total -= cache.popitem(last=False)[1][1]
+
+def reset_heavy_state():
+    """Drop the memory-heavy per-session state: reports, cached bundles, activity list"""
+    st.session_state.analysis_result = None
+    st.session_state.pending_analysis = None
+    st.session_state.result_cache = OrderedDict()
+    st.session_state.recent_history = None
+
 def clear_analysis_result():
     """Clear saved analysis result"""
     st.session_state.analysis_result = None
+
+def _activity_row(record: dict) -> dict:
+    """Project a history document down to the plain strings the Overview shows"""
+    return {
+        "classification": str(record.get("classification")),
+        "source_type": str(record.get("source_type")),
+        "timestamp": str(record.get("timestamp")),
+    }
+
+def get_recent_history() -> Optional[list]:
+    """Get the session's recent-activity rows (None until seeded from the DB)"""
+    return st.session_state.get("recent_history", None)
+
+def set_recent_history(history: list, limit: int = 10):
+    """Seed the session's recent-activity rows from full history documents"""
+    st.session_state.recent_history = [_activity_row(r) for r in history[:limit]]
+
+def push_recent_history(record: dict, limit: int = 10):
+    """Prepend a freshly saved analysis to the recent-activity rows, if seeded"""
+    recent = st.session_state.get("recent_history", None)
+    if recent is not None:
+        st.session_state.recent_history = [_activity_row(record)] + recent[:limit - 1]
@@ -3,11 +3,37 @@ Bias and Sentiment Analyzer
 Analyzes text for emotional tone, political bias indicators, and sensationalism.
 """
 
-from transformers import pipeline
+import os
+import torch
+import re
+from transformers import AutoTokenizer, pipeline
 import config
 from src.utils.logger import get_logger
+from src.utils.model_cache import build_once
+from src.utils.torch_threads import configure_torch_threads
+
+try:
+    # Optional: ONNX Runtime int8 backend for the sentiment model
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForSequenceClassification = None
 
 logger = get_logger(__name__)
+# No-op when app startup already did it; covers use outside the app
+configure_torch_threads()
+
+# Heuristic lists for bias/sensationalism (Simplified for efficacy vs efficiency)
+SENSATIONAL_WORDS = frozenset({
+    "shocking", "unbelievable", "mind-blowing", "secret", "exposed", 
+    "breaking", "urgent", "you won't believe", "miracle", "cure",
+    "conspiracy", "mainstream media", "hidden agenda", "destroy"
+})
+# One pass over the text; unlike per-word lookups this also catches the multi-word phrases
+_SENSATIONAL_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(SENSATIONAL_WORDS, key=len, reverse=True))) + r")\b",
+    re.IGNORECASE
+)
 
 class BiasSentimentAnalyzer:
     def __init__(self):
@@ -15,21 +41,53 @@ class BiasSentimentAnalyzer:
         self.pipeline = None
         self._load_model()
         
-        # Heuristic lists for bias/sensationalism (Simplified for efficacy vs efficiency)
-        self.sensational_words = {
-            "shocking", "unbelievable", "mind-blowing", "secret", "exposed", 
-            "breaking", "urgent", "you won't believe", "miracle", "cure",
-            "conspiracy", "mainstream media", "hidden agenda", "destroy"
-        }
+        self.sensational_words = SENSATIONAL_WORDS
+
+    def _onnx_int8_model(self):
+        """
+        Load the int8 ONNX export of the sentiment model, exporting and
+        quantizing it into MODEL_CACHE_DIR on first use.
+        """
+        def export(save_dir):
+            logger.info("Exporting sentiment model to ONNX (int8, one-time)...")
+            model = ORTModelForSequenceClassification.from_pretrained(self.sentiment_model, export=True)
+            quantizer = ORTQuantizer.from_pretrained(model)
+            quantizer.quantize(
+                save_dir=save_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            )
+
+        save_dir = build_once(
+            os.path.join(config.MODEL_CACHE_DIR, "distilbert-sst2-onnx-int8"), "model_quantized.onnx", export
+        )
+        return ORTModelForSequenceClassification.from_pretrained(save_dir, file_name="model_quantized.onnx")
 
     def _load_model(self):
+        if ORTModelForSequenceClassification is not None and not config.FORCE_FP32:
+            try:
+                logger.info("Loading Sentiment Analysis pipeline (ONNX Runtime int8)...")
+                self.pipeline = pipeline(
+                    "sentiment-analysis",
+                    model=self._onnx_int8_model(),
+                    tokenizer=AutoTokenizer.from_pretrained(self.sentiment_model)
+                )
+                return
+            except Exception as e:
+                logger.warning(f"ONNX sentiment model unavailable, using PyTorch: {e}")
         try:
             logger.info("Loading Sentiment Analysis pipeline...")
             self.pipeline = pipeline(
                 "sentiment-analysis", 
                 model=self.sentiment_model,
-                device=-1 # CPU for this lighter model to save GPU for DeBERTa
+                device=-1, # CPU for this lighter model to save GPU for DeBERTa
+                model_kwargs={"low_cpu_mem_usage": True}
             )
+            # Runs on CPU: dynamic int8 quantization of the Linear layers
+            if not config.FORCE_FP32:
+                self.pipeline.model = torch.quantization.quantize_dynamic(
+                    self.pipeline.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info("Applied int8 dynamic quantization to sentiment model")
         except Exception as e:
             logger.error(f"Failed to load sentiment model: {e}")
             self.pipeline = None
@@ -38,48 +96,58 @@ class BiasSentimentAnalyzer:
         """
         Analyze text for sentiment and sensationalism
         """
-        if not text:
-            return {}
-            
-        result = {
-            "sentiment": "Neutral",
-            "sentiment_score": 0.0,
-            "sensationalism_score": 0.0,
-            "bias_label": "Unknown"
-        }
+        return self.analyze_batch([text])[0]
+
+    def analyze_batch(self, texts: list[str]) -> list[dict]:
+        """
+        Analyze several texts with a single sentiment pipeline call.
+        Returns one result dictionary per input, in order (empty for empty input).
+        """
+        results = [{} for _ in texts]
+        batch_idx = [i for i, t in enumerate(texts) if t]
+        for i in batch_idx:
+            results[i] = {
+                "sentiment": "Neutral",
+                "sentiment_score": 0.0,
+                "sensationalism_score": 0.0,
+                "bias_label": "Unknown"
+            }
         
         # 1. Sentiment Analysis
-        if self.pipeline:
+        if self.pipeline and batch_idx:
             try:
-                # Truncate to 512 tokens for distilbert
-                short_text = text[:1500] 
-                res = self.pipeline(short_text)[0]
-                result["sentiment"] = res["label"] # POSITIVE / NEGATIVE
-                result["sentiment_score"] = res["score"]
-                
-                # Risk Logic: Extreme sentiment (very close to 1.0) is suspicious
-                # If score > 0.95 (Positive or Negative), it's highly emotional
-                result["sentiment_intensity"] = res["score"]
+                # The fast tokenizer truncates to DistilBERT's exact 512-token limit
+                outputs = self.pipeline(
+                    [texts[i] for i in batch_idx], batch_size=16, truncation=True, max_length=512
+                )
+                for i, res in zip(batch_idx, outputs):
+                    results[i]["sentiment"] = res["label"] # POSITIVE / NEGATIVE
+                    results[i]["sentiment_score"] = res["score"]
+                    
+                    # Risk Logic: Extreme sentiment (very close to 1.0) is suspicious
+                    # If score > 0.95 (Positive or Negative), it's highly emotional
+                    results[i]["sentiment_intensity"] = res["score"]
             except Exception as e:
                 logger.error(f"Sentiment analysis failed: {e}")
         
-        # 2. Sensationalism Score (Heuristic)
-        words = text.lower().split()
-        word_count = len(words)
-        if word_count > 0:
-            match_count = sum(1 for w in words if w in self.sensational_words)
-            # Normalize: matches per 100 words
-            result["sensationalism_score"] = min(1.0, (match_count / word_count) * 10) 
-            
-        # 3. Combined Risk Calculation
-        # Risk is higher if Sensationalism is high OR Sentiment is extreme
-        # Heuristic: Risk = (Sensationalism * 0.7) + (SentimentIntensity > 0.9 ? 0.3 : 0)
-        
-        sentiment_risk = 0.0
-        if result.get("sentiment_intensity", 0) > 0.9:
-            sentiment_risk = 1.0
+        for i in batch_idx:
+            text, result = texts[i], results[i]
+            # 2. Sensationalism Score (Heuristic)
+            word_count = len(text.split())
+            if word_count > 0:
+                match_count = len(_SENSATIONAL_RE.findall(text))
+                # Normalize: matches per 100 words
+                result["sensationalism_score"] = min(1.0, (match_count / word_count) * 10) 
+                
+            # 3. Combined Risk Calculation
+            # Risk is higher if Sensationalism is high OR Sentiment is extreme
+            # Heuristic: Risk = (Sensationalism * 0.7) + (SentimentIntensity > 0.9 ? 0.3 : 0)
             
-        final_risk = (result["sensationalism_score"] * 0.7) + (sentiment_risk * 0.3)
-        result["risk_score"] = min(1.0, final_risk) * 100 # 0-100 scale
+            sentiment_risk = 0.0
+            if result.get("sentiment_intensity", 0) > 0.9:
+                sentiment_risk = 1.0
+                
+            final_risk = (result["sensationalism_score"] * 0.7) + (sentiment_risk * 0.3)
+            result["risk_score"] = min(1.0, final_risk) * 100 # 0-100 scale
             
-        return result
+        return results
@@ -4,6 +4,7 @@ Calculates the final credibility score based on multiple signals.
 """
 
 from typing import Dict, Any, List
+import numpy as np
 import config
 from src.utils.logger import get_logger
 
@@ -20,6 +21,13 @@ class CredibilityScorer:
             "source_credibility": 0.15,
             "entity_verification": 0.10
         }
+        # Same weights as a vector, in calculate_scores column order
+        self._weight_vec = np.array([
+            self.weights["ml_model"], self.weights["keyword_risk"], self.weights["sentiment"],
+            self.weights["source_credibility"], self.weights["entity_verification"]
+        ])
+        # Columns that arrive as risks and are flipped to safety (100 - risk)
+        self._risk_cols = np.array([False, True, True, False, False])
 
     def calculate_score(self, 
                         ml_score: float,
@@ -82,3 +90,15 @@ class CredibilityScorer:
             "color": color,
             "breakdown": analysis_breakdown
         }
+
+    def calculate_scores(self, signals) -> np.ndarray:
+        """
+        Vectorized weighted score for many rows at once.
+        `signals` is array-like of shape (N, 5), columns in the order of
+        calculate_score's arguments: ml, keyword risk, sentiment risk,
+        source, entity. Returns the N clipped 0-100 final scores; use
+        calculate_score for a single row with rating and breakdown.
+        """
+        signals = np.asarray(signals, dtype=np.float64).reshape(-1, 5)
+        safeties = np.where(self._risk_cols, np.maximum(0, 100 - signals), signals)
+        return np.clip(safeties @ self._weight_vec, 0.0, 100.0)
@@ -3,10 +3,23 @@ Entity Verifier (Layer 5)
 Extracts and verifies named entities (People, Orgs, Locs) to check context validity.
 """
 
+import re
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+RELEVANT_LABELS = frozenset({"ORG", "PERSON", "GPE", "LOC"})
+
+# Simulation Logic:
+# If entities match known "high credibility" anchors (simulated list), boost score.
+# Use a small set of universally known entities to demonstrate logic.
+KNOWN_ANCHORS = frozenset({
+    "WHO", "NASA", "CDC", "UN", "FBI", "Apple", "Google", "Microsoft",
+    "White House", "Parliament", "Supreme Court", "BBC", "CNN"
+})
+# Substring match against every anchor in one scan per entity
+_ANCHOR_RE = re.compile("|".join(map(re.escape, sorted(KNOWN_ANCHORS, key=len, reverse=True))))
+
 class EntityVerifier:
     def __init__(self):
         # In a real system, this would connect to a Knowledge Graph (Wikidata/Google KG)
@@ -23,20 +36,12 @@ class EntityVerifier:
             return {"score": 40.0, "reason": "No specific entities mentioned (vague)."}
 
         # Filter relevant types
-        relevant_ents = [e for e in entities if e[1] in ["ORG", "PERSON", "GPE", "LOC"]]
+        relevant_ents = [e for e in entities if e[1] in RELEVANT_LABELS]
         
         if not relevant_ents:
              return {"score": 50.0, "reason": "No verifies people or organizations found."}
 
-        # Simulation Logic:
-        # If entities match known "high credibility" anchors (simulated list), boost score.
-        # Use a small set of universally known entities to demonstrate logic.
-        known_anchors = {
-            "WHO", "NASA", "CDC", "UN", "FBI", "Apple", "Google", "Microsoft",
-            "White House", "Parliament", "Supreme Court", "BBC", "CNN"
-        }
-        
-        matches = [e[0] for e in relevant_ents if any(k in e[0] for k in known_anchors)]
+        matches = [e[0] for e in relevant_ents if _ANCHOR_RE.search(e[0])]
         
         if matches:
             return {
@@ -3,7 +3,11 @@ Google Fact Check API Integration
 """
 
 import requests
+import threading
 import urllib.parse
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config
 from src.utils.logger import get_logger
 
@@ -13,6 +17,17 @@ class FactCheckAPI:
     def __init__(self):
         self.api_key = config.GOOGLE_FACTCHECK_API_KEY
         self.api_url = config.FACTCHECK_API_URL
+        # Pooled keep-alive connections: repeat queries skip the TCP/TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
+        # Successful results by normalized query, kept for an hour and shared across sessions
+        self._results = TTLCache(maxsize=512, ttl=3600)
+        self._results_lock = threading.Lock()
 
     def search_claims(self, query: str) -> list[dict]:
         """
@@ -20,6 +35,12 @@ class FactCheckAPI:
         """
         if not query or not self.api_key:
             return []
+
+        key = query.strip().lower()
+        with self._results_lock:
+            hit = self._results.get(key)
+        if hit is not None:
+            return [dict(r) for r in hit] # Copies, so callers can't mutate the cached results
             
         try:
             params = {
@@ -30,11 +51,14 @@ class FactCheckAPI:
             }
             
             logger.info(f"Querying Fact Check API for: {query[:30]}...")
-            response = requests.get(self.api_url, params=params, timeout=config.REQUEST_TIMEOUT)
+            response = self.session.get(self.api_url, params=params, timeout=config.REQUEST_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
-                return self._parse_response(data)
+                results = self._parse_response(data)
+                with self._results_lock:
+                    self._results[key] = [dict(r) for r in results]
+                return results
             else:
                 logger.warning(f"Fact Check API Error: {response.status_code}")
                 return []
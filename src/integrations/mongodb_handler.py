@@ -3,9 +3,14 @@ MongoDB Integration Handler
 Handles database connections and CRUD operations for Users and News Logs
 """
 
+import atexit
+import json
+import os
+import sqlite3
+import threading
 import pymongo
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, OperationFailure
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure, DuplicateKeyError
 import certifi
 from datetime import datetime
 from bson.objectid import ObjectId
@@ -15,8 +20,23 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_LOCAL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (_id TEXT PRIMARY KEY, email TEXT NOT NULL UNIQUE, doc TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS news_logs (_id TEXT PRIMARY KEY, user_id TEXT NOT NULL, timestamp TEXT NOT NULL, doc TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS idx_logs_user_ts ON news_logs (user_id, timestamp DESC);
+"""
+
 class MongoDBHandler:
     _instance = None
+    # The only fields paged history listings carry (plus _id and the text preview);
+    # everything else is loaded per item by get_history_item
+    HISTORY_LIST_FIELDS = ("user_id", "timestamp", "classification", "credibility_score", "source_type")
+    # Everything login and cookie auto-login read from a user document (_id is implicit)
+    USER_AUTH_PROJECTION = {"name": 1, "email": 1, "password_hash": 1}
+    # queue_analysis write-behind: flush after this many records or seconds, whichever first
+    WRITE_BUFFER_MAX = 100
+    WRITE_FLUSH_INTERVAL = 2.0
+    WRITE_RETRY_INTERVAL = 10.0 # after a failed batch insert
     
     def __new__(cls):
         """Singleton pattern to ensure only one database connection"""
@@ -26,12 +46,21 @@ class MongoDBHandler:
         return cls._instance
     
     def _initialize(self):
-        """Initialize MongoDB connection with JSON fallback"""
+        """Initialize MongoDB connection with local SQLite fallback"""
         self.use_fallback = False
+        # Whether the database itself rejects duplicate emails (SQLite's UNIQUE column, or Mongo's index)
+        self._email_unique = True
+        # Queued (record, on_saved) pairs; _flush_lock keeps batches in order
+        self._write_buffer = []
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer = None
+        self._flush_retrying = False # last batch insert failed; wait for its retry timer
+        atexit.register(self.flush)
         try:
             # Check if URI is default/placeholder
             if "localhost" in config.MONGODB_URI or "username" in config.MONGODB_URI:
-                logger.warning("MongoDB URI not configured. Using local JSON fallback.")
+                logger.warning("MongoDB URI not configured. Using local SQLite fallback.")
                 self.use_fallback = True
                 self._init_fallback()
                 return
@@ -46,78 +75,118 @@ class MongoDBHandler:
             self.db = self.client[config.DB_NAME]
             self.users = self.db[config.USERS_COLLECTION]
             self.news_logs = self.db[config.NEWS_LOGS_COLLECTION]
+            # History is always read per user, newest first
+            self.news_logs.create_index([("user_id", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING)])
+            # Signup relies on this to reject duplicate emails in the insert itself
+            try:
+                self.users.create_index([("email", pymongo.ASCENDING)], unique=True)
+            except OperationFailure as e:
+                # create_user falls back to checking for the email before inserting
+                self._email_unique = False
+                logger.error(f"Could not create unique email index (existing duplicates?), signup will look up emails first: {e}")
             logger.info("Successfully connected to MongoDB Atlas")
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
-            logger.warning("Switching to local JSON fallback mode.")
+            logger.warning("Switching to local SQLite fallback mode.")
             self.use_fallback = True
             self._init_fallback()
 
     def _init_fallback(self):
-        """Initialize local JSON storage"""
-        import json
-        import os
-        self.local_db_path = "local_db.json"
-        if not os.path.exists(self.local_db_path):
-            with open(self.local_db_path, "w") as f:
-                json.dump({"users": [], "news_logs": []}, f)
-
-    def _read_local_db(self):
-        import json
-        try:
-            with open(self.local_db_path, "r") as f:
-                return json.load(f)
-        except:
-            return {"users": [], "news_logs": []}
+        """
+        Initialize local SQLite storage (WAL journal). Documents are kept as JSON
+        blobs next to the indexed columns that lookups filter and sort on.
+        A legacy local_db.json is imported into a new, empty database.
+        """
+        self.local_db_path = "local_db.sqlite3"
+        self._local_lock = threading.RLock()
+        self._local = sqlite3.connect(self.local_db_path, check_same_thread=False)
+        self._local.execute("PRAGMA journal_mode=WAL")
+        self._local.execute("PRAGMA synchronous=NORMAL")
+        with self._local_lock, self._local:
+            self._local.executescript(_LOCAL_SCHEMA)
+        self._import_legacy_json("local_db.json")
+
+    def _import_legacy_json(self, path):
+        if not os.path.exists(path):
+            return
+        with self._local_lock:
+            if self._local.execute("SELECT EXISTS(SELECT 1 FROM users) OR EXISTS(SELECT 1 FROM news_logs)").fetchone()[0]:
+                return
+            try:
+                with open(path, "r") as f:
+                    data = json.load(f)
+                with self._local:
+                    self._local.executemany(
+                        "INSERT OR IGNORE INTO users VALUES (?, ?, ?)",
+                        [(str(u["_id"]), u["email"], self._dumps(u)) for u in data.get("users", [])]
+                    )
+                    self._local.executemany(
+                        "INSERT OR IGNORE INTO news_logs VALUES (?, ?, ?, ?)",
+                        [self._log_row(log) for log in data.get("news_logs", [])]
+                    )
+                logger.info(f"Imported {path} into {self.local_db_path}")
+            except Exception as e:
+                logger.error(f"Legacy JSON import failed: {e}")
 
-    def _write_local_db(self, data):
-        import json
-        with open(self.local_db_path, "w") as f:
-            json.dump(data, f, indent=4, default=str)
+    @staticmethod
+    def _dumps(doc: Dict) -> str:
+        return json.dumps(doc, default=str)
+
+    def _log_row(self, log: Dict) -> tuple:
+        return (str(log["_id"]), str(log["user_id"]), str(log.get("timestamp")), self._dumps(log))
+
+    def _local_one(self, sql: str, params: tuple) -> Optional[Dict]:
+        with self._local_lock:
+            row = self._local.execute(sql, params).fetchone()
+        return json.loads(row[0]) if row else None
 
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         if self.use_fallback:
-            data = self._read_local_db()
-            for user in data["users"]:
-                if user["email"] == email:
-                    return user
-            return None
+            return self._local_one("SELECT doc FROM users WHERE email = ?", (email,))
         if self.users is None: return None
-        return self.users.find_one({"email": email})
+        return self.users.find_one({"email": email}, self.USER_AUTH_PROJECTION)
 
     def get_user_by_id(self, user_id: str) -> Optional[Dict]:
         if self.use_fallback:
-            data = self._read_local_db()
-            for user in data["users"]:
-                if str(user.get("_id")) == str(user_id):
-                    return user
-            return None
+            return self._local_one("SELECT doc FROM users WHERE _id = ?", (str(user_id),))
         if self.users is None: return None
         try:
-            return self.users.find_one({"_id": ObjectId(user_id)})
+            return self.users.find_one({"_id": ObjectId(user_id)}, self.USER_AUTH_PROJECTION)
         except:
             return None
 
     def create_user(self, user_data: Dict) -> bool:
+        """
+        Insert a new user. Raises DuplicateKeyError if the email is taken,
+        so callers need no separate existence lookup.
+        """
         user_data["created_at"] = datetime.utcnow()
         user_data["last_login"] = datetime.utcnow()
         
         if self.use_fallback:
             try:
-                data = self._read_local_db()
                 # Simulate ObjectId
                 user_data["_id"] = str(ObjectId())
-                data["users"].append(user_data)
-                self._write_local_db(data)
+                with self._local_lock, self._local:
+                    self._local.execute(
+                        "INSERT INTO users VALUES (?, ?, ?)",
+                        (user_data["_id"], user_data["email"], self._dumps(user_data))
+                    )
                 return True
+            except sqlite3.IntegrityError:
+                raise DuplicateKeyError(f"duplicate email: {user_data['email']}")
             except Exception as e:
                 logger.error(f"Fallback create error: {e}")
                 return False
 
         if self.users is None: return False
+        if not self._email_unique and self.users.find_one({"email": user_data["email"]}, {"_id": 1}):
+            raise DuplicateKeyError(f"duplicate email: {user_data['email']}")
         try:
             self.users.insert_one(user_data)
             return True
+        except DuplicateKeyError:
+            raise
         except Exception as e:
             logger.error(f"Error creating user: {e}")
             return False
@@ -138,11 +207,10 @@ class MongoDBHandler:
             
         if self.use_fallback:
             try:
-                data = self._read_local_db()
                 analysis_data["_id"] = str(ObjectId())
                 analysis_data["user_id"] = str(analysis_data["user_id"])
-                data["news_logs"].append(analysis_data)
-                self._write_local_db(data)
+                with self._local_lock, self._local:
+                    self._local.execute("INSERT INTO news_logs VALUES (?, ?, ?, ?)", self._log_row(analysis_data))
                 return True
             except Exception as e:
                 logger.error(f"Fallback save error: {e}")
@@ -158,22 +226,144 @@ class MongoDBHandler:
             logger.error(f"Error saving analysis: {e}")
             return False
 
-    def get_user_history(self, user_id: str, limit: int = 50) -> List[Dict]:
+    def save_analyses(self, docs: List[Dict]) -> bool:
+        """Insert several analysis records in one round trip (one transaction in fallback mode)."""
+        if not docs:
+            return True
+        for doc in docs:
+            doc.setdefault("timestamp", datetime.utcnow())
+
         if self.use_fallback:
-            data = self._read_local_db()
-            user_logs = [
-                log for log in data["news_logs"] 
-                if str(log.get("user_id")) == str(user_id)
-            ]
-            # Sort by timestamp desc (simple string sort for fallback)
-            user_logs.sort(key=lambda x: str(x.get("timestamp")), reverse=True)
-            return user_logs[:limit]
+            try:
+                for doc in docs:
+                    doc.setdefault("_id", str(ObjectId()))
+                    doc["user_id"] = str(doc["user_id"])
+                with self._local_lock, self._local:
+                    self._local.executemany("INSERT INTO news_logs VALUES (?, ?, ?, ?)", [self._log_row(d) for d in docs])
+                return True
+            except Exception as e:
+                logger.error(f"Fallback batch save error: {e}")
+                return False
+
+        if self.news_logs is None: return False
+        try:
+            for doc in docs:
+                if "user_id" in doc and isinstance(doc["user_id"], str):
+                    doc["user_id"] = ObjectId(doc["user_id"])
+            self.news_logs.insert_many(docs, ordered=False)
+            return True
+        except BulkWriteError as e:
+            # insert_many sets each doc's _id, so a retried batch only collides with
+            # the records that made it in last time; everything else is now written
+            if all(err.get("code") == 11000 for err in e.details.get("writeErrors", [])) \
+                    and not e.details.get("writeConcernErrors"):
+                return True
+            logger.error(f"Error batch-saving analyses: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error batch-saving analyses: {e}")
+            return False
+
+    def queue_analysis(self, analysis_data: Dict, on_saved=None):
+        """
+        Buffer an analysis record for a batched background insert, written within
+        WRITE_FLUSH_INTERVAL seconds or once WRITE_BUFFER_MAX records are queued.
+        on_saved() is called after the batch holding the record is written.
+        Use save_analysis to write synchronously.
+        """
+        with self._buffer_lock:
+            self._write_buffer.append((analysis_data, on_saved))
+            if self._flush_timer is not None and (
+                self._flush_retrying or len(self._write_buffer) < self.WRITE_BUFFER_MAX
+            ):
+                return
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            delay = 0 if len(self._write_buffer) >= self.WRITE_BUFFER_MAX else self.WRITE_FLUSH_INTERVAL
+            self._flush_timer = threading.Timer(delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> bool:
+        """
+        Write all queued analysis records now. Returns False if the batch insert
+        failed; the records then stay queued and are retried after WRITE_RETRY_INTERVAL.
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                batch, self._write_buffer = self._write_buffer, []
+            if not batch:
+                return True
+            if not self.save_analyses([doc for doc, _ in batch]):
+                with self._buffer_lock:
+                    # Keep the batch (and its callbacks) ahead of anything queued meanwhile
+                    self._write_buffer[:0] = batch
+                    self._flush_retrying = True
+                    if self._flush_timer is not None:
+                        self._flush_timer.cancel()
+                    self._flush_timer = threading.Timer(self.WRITE_RETRY_INTERVAL, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                logger.warning(f"Retrying {len(batch)} queued analysis records in {self.WRITE_RETRY_INTERVAL:.0f}s")
+                return False
+            self._flush_retrying = False
+        for callback in {cb for _, cb in batch if cb is not None}:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Post-save callback failed: {e}")
+        return True
+
+    def get_user_history(self, user_id: str, limit: int = 50, text_preview_len: Optional[int] = None, before_ts: Any = None) -> List[Dict]:
+        """
+        Fetch a user's analyses, newest first.
+        before_ts is a keyset cursor: only rows older than it are returned,
+        so paging is an index seek rather than an OFFSET scan.
+        With text_preview_len, rows are projected server-side to
+        HISTORY_LIST_FIELDS plus an article_text_preview of that many
+        characters; get_history_item loads the rest.
+        """
+        if self.use_fallback:
+            # Timestamps are compared as strings, which sort chronologically
+            where = "user_id = ?" + ("" if before_ts is None else " AND timestamp < ?")
+            params = (str(user_id),) + (() if before_ts is None else (str(before_ts),))
+            if text_preview_len is None:
+                sql = f"SELECT doc FROM news_logs WHERE {where} ORDER BY timestamp DESC LIMIT ?"
+            else:
+                # Project in SQL so only the listed fields are decoded
+                fields = ", ".join(f"'{field}', json_extract(doc, '$.{field}')" for field in self.HISTORY_LIST_FIELDS)
+                sql = (
+                    f"SELECT json_object('_id', _id, {fields}, "
+                    "'article_text_preview', substr(coalesce(json_extract(doc, '$.article_text'), ''), 1, ?)) "
+                    f"FROM news_logs WHERE {where} ORDER BY timestamp DESC LIMIT ?"
+                )
+                params = (text_preview_len,) + params
+            with self._local_lock:
+                rows = self._local.execute(sql, params + (limit,)).fetchall()
+            return [json.loads(row[0]) for row in rows]
 
         if self.news_logs is None: return []
         try:
-            cursor = self.news_logs.find(
-                {"user_id": ObjectId(user_id)}
-            ).sort("timestamp", pymongo.DESCENDING).limit(limit)
+            query = {"user_id": ObjectId(user_id)}
+            if before_ts is not None:
+                query["timestamp"] = {"$lt": before_ts}
+            if text_preview_len is None:
+                cursor = self.news_logs.find(query).sort("timestamp", pymongo.DESCENDING).limit(limit)
+            else:
+                cursor = self.news_logs.aggregate([
+                    {"$match": query},
+                    {"$sort": {"timestamp": pymongo.DESCENDING}},
+                    {"$limit": limit},
+                    {"$project": {
+                        **{field: 1 for field in self.HISTORY_LIST_FIELDS},
+                        "article_text_preview": {
+                            "$substrCP": [{"$ifNull": ["$article_text", ""]}, 0, text_preview_len]
+                        }
+                    }}
+                ])
             results = []
             for doc in cursor:
                 doc["_id"] = str(doc["_id"])
@@ -183,3 +373,21 @@ class MongoDBHandler:
         except Exception as e:
             logger.error(f"Error fetching history: {e}")
             return []
+
+    def get_history_item(self, item_id: str, user_id: str) -> Optional[Dict]:
+        """Fetch one full analysis record, scoped to its owner."""
+        if self.use_fallback:
+            return self._local_one(
+                "SELECT doc FROM news_logs WHERE _id = ? AND user_id = ?", (str(item_id), str(user_id))
+            )
+
+        if self.news_logs is None: return None
+        try:
+            doc = self.news_logs.find_one({"_id": ObjectId(item_id), "user_id": ObjectId(user_id)})
+            if doc:
+                doc["_id"] = str(doc["_id"])
+                doc["user_id"] = str(doc["user_id"])
+            return doc
+        except Exception as e:
+            logger.error(f"Error fetching history item: {e}")
+            return None
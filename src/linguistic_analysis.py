@@ -4,11 +4,30 @@ Detects "Red Flags" using rule-based stylistic analysis.
 """
 
 import re
-import textstat
+import numpy as np
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def _compile_any(patterns):
+    """One case-insensitive alternation over all patterns; group p<i> marks patterns[i]"""
+    return re.compile("|".join(f"(?P<p{i}>{p})" for i, p in enumerate(patterns)), re.IGNORECASE)
+
+_VOWEL_GROUP = re.compile(r'[aeiouy]+', re.IGNORECASE)
+
+def _flesch_reading_ease(text: str) -> float:
+    """Flesch reading ease, approximating syllables as vowel groups (at least one per word)"""
+    words = text.split()
+    n_words = max(len(words), 1)
+    n_sentences = text.count('.') + text.count('!') + text.count('?') or 1
+    syllables = sum(max(1, len(_VOWEL_GROUP.findall(w))) for w in words)
+    return 206.835 - 1.015 * (n_words / n_sentences) - 84.6 * (syllables / n_words)
+
+def _matched_patterns(regex, patterns, text):
+    """Patterns found in text (in list order), from a single scan"""
+    hits = {m.lastgroup for m in regex.finditer(text)}
+    return [p for i, p in enumerate(patterns) if f"p{i}" in hits]
+
 class LinguisticAnalyzer:
     def __init__(self):
         # 🚩 1. Extreme Claims / Absolutism
@@ -24,6 +43,8 @@ class LinguisticAnalyzer:
             r"new world order", r"globalist", r"agenda", r"hoax", r"plandemic",
             r"sheeple", r"wake up"
         ]
+        self._extreme_re = _compile_any(self.extreme_patterns)
+        self._conspiracy_re = _compile_any(self.conspiracy_patterns)
 
     def analyze(self, text: str) -> dict:
         """
@@ -37,13 +58,13 @@ class LinguisticAnalyzer:
         score = 0.0
         
         # 1. Check Extreme Claims
-        extreme_matches = [p for p in self.extreme_patterns if re.search(p, text, re.IGNORECASE)]
+        extreme_matches = _matched_patterns(self._extreme_re, self.extreme_patterns, text)
         if extreme_matches:
             score += 20 * len(extreme_matches) # 20 points per match
             flags.append(f"Contains extreme claims: {', '.join(extreme_matches)}")
 
         # 2. Check Conspiracy Language
-        conspiracy_matches = [p for p in self.conspiracy_patterns if re.search(p, text, re.IGNORECASE)]
+        conspiracy_matches = _matched_patterns(self._conspiracy_re, self.conspiracy_patterns, text)
         if conspiracy_matches:
             score += 25 * len(conspiracy_matches)
             flags.append(f"Uses conspiracy terminology: {', '.join(conspiracy_matches)}")
@@ -63,7 +84,7 @@ class LinguisticAnalyzer:
         # 🧠 Advanced Add-On: Readability Score
         # Fake news often has lower readability (simple, emotional)
         try:
-            readability = textstat.flesch_reading_ease(text)
+            readability = _flesch_reading_ease(text)
             # Flesch Score: 90-100 (Very Easy), 0-30 (Very Confusing)
             # If extremely simple and high risk elsewhere -> suspicious
             # We won't add to score directly but return it
@@ -81,8 +102,10 @@ class LinguisticAnalyzer:
         }
 
     def _calculate_caps_ratio(self, text: str) -> float:
-        clean_text = re.sub(r'[^a-zA-Z]', '', text)
-        if not clean_text:
+        # Byte compares over the ASCII letters (other characters never counted) instead of a per-char loop
+        arr = np.frombuffer(text.encode('ascii', 'ignore'), dtype=np.uint8)
+        upper = (arr >= 65) & (arr <= 90)
+        letters = int(np.count_nonzero(upper | ((arr >= 97) & (arr <= 122))))
+        if not letters:
             return 0.0
-        caps_count = sum(1 for c in clean_text if c.isupper())
-        return caps_count / len(clean_text)
+        return int(np.count_nonzero(upper)) / letters
@@ -0,0 +1,28 @@
+"""
+Transformer model wrappers.
+
+Exports are resolved lazily (PEP 562) so torch / transformers are only
+imported when a model class is first accessed.
+"""
+
+import importlib
+
+_LAZY_EXPORTS = {
+    "DebertaClassifier": ".deberta_classifier",
+    "SemanticVerifier": ".semantic_verifier",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ is skipped next time
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,18 +3,36 @@ Semantic Verifier
 Uses Sentence-BERT to compare extracted claims with trusted knowledge/sources.
 """
 
+import threading
+from collections import OrderedDict
 from sentence_transformers import SentenceTransformer, util
 import config
 from src.utils.logger import get_logger
+from src.utils.torch_threads import configure_torch_threads
 import torch
 
+try:
+    import faiss  # Optional: indexed lookup for large trusted-source sets
+except ImportError:
+    faiss = None
+
 logger = get_logger(__name__)
+# No-op when app startup already did it; covers use outside the app
+configure_torch_threads()
 
 class SemanticVerifier:
+    SOURCE_CACHE_SIZE = 8
+    # Corpora at least this large get an approximate HNSW index instead of exact search
+    HNSW_MIN_SOURCES = 10000
+
     def __init__(self):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.model_name = config.SBERT_MODEL_NAME
         self.model = None
+        # encode_sources results by source list; corpora change rarely and the
+        # instance is shared across sessions, hence the lock
+        self._source_cache = OrderedDict()
+        self._source_lock = threading.Lock()
         
         self._load_model()
 
@@ -23,11 +41,68 @@ class SemanticVerifier:
         try:
             logger.info(f"Loading Sentence-BERT model: {self.model_name}")
             self.model = SentenceTransformer(self.model_name, device=self.device)
+            self.model.eval()
+            if self.device == "cuda":
+                # FP16 weights: half the memory traffic per forward pass
+                self.model.half()
+            elif not config.FORCE_FP32:
+                # Dynamic int8 quantization of Linear layers for CPU inference
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info("Applied int8 dynamic quantization to Sentence-BERT model")
             logger.info("Sentence-BERT model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load Sentence-BERT: {e}")
             raise
 
+    def _encode(self, texts: list[str]):
+        """
+        Encode texts as unit-length embeddings on the model device, so a
+        single matmul gives cosine similarity. FP16 on GPU to halve bandwidth.
+        """
+        embeddings = self.model.encode(texts, convert_to_tensor=True, normalize_embeddings=True)
+        if self.device == "cuda":
+            embeddings = embeddings.half()
+        return embeddings
+
+    def encode_sources(self, reliable_sources: list[str]):
+        """
+        Pre-encode reliable source texts once so they can be reused
+        across calls to verify_claims_precomputed. Memoized per exact
+        source list (LRU of SOURCE_CACHE_SIZE).
+        """
+        key = tuple(reliable_sources)
+        with self._source_lock:
+            embeddings = self._source_cache.get(key)
+            if embeddings is not None:
+                self._source_cache.move_to_end(key)
+                return embeddings
+        embeddings = self._encode(list(key))
+        with self._source_lock:
+            self._source_cache[key] = embeddings
+            while len(self._source_cache) > self.SOURCE_CACHE_SIZE:
+                self._source_cache.popitem(last=False)
+        return embeddings
+
+    def build_source_index(self, source_embeddings):
+        """
+        Build a FAISS inner-product index over embeddings from encode_sources.
+        Since they are normalized, inner product equals cosine similarity.
+        Exact (flat) search below HNSW_MIN_SOURCES, approximate HNSW above.
+        Returns None when faiss is not installed (matmul path is used instead).
+        """
+        if faiss is None or source_embeddings is None:
+            return None
+        vectors = source_embeddings.float().cpu().numpy()
+        if len(vectors) >= self.HNSW_MIN_SOURCES:
+            index = faiss.IndexHNSWFlat(vectors.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efSearch = 64
+        else:
+            index = faiss.IndexFlatIP(vectors.shape[1])
+        index.add(vectors)
+        return index
+
     def verify_claims(self, claims: list[str], reliable_sources: list[str]) -> list[dict]:
         """
         Compare extracted claims against a list of reliable source texts/headlines.
@@ -36,20 +111,38 @@ class SemanticVerifier:
         if not claims or not reliable_sources:
             return []
 
+        try:
+            source_embeddings = self.encode_sources(reliable_sources)
+        except Exception as e:
+            logger.error(f"Error in semantic verification: {e}")
+            return []
+        return self.verify_claims_precomputed(claims, reliable_sources, source_embeddings)
+
+    def verify_claims_precomputed(self, claims: list[str], reliable_sources: list[str], source_embeddings, source_index=None) -> list[dict]:
+        """
+        Same as verify_claims, but reuses embeddings from encode_sources
+        so only the claims go through the model. If a source_index from
+        build_source_index is given, the best match is looked up there.
+        """
+        if not claims or not reliable_sources or source_embeddings is None:
+            return []
+
         results = []
         try:
-            # Encode lists
-            claim_embeddings = self.model.encode(claims, convert_to_tensor=True)
-            source_embeddings = self.model.encode(reliable_sources, convert_to_tensor=True)
-
-            # Compute cosine similarity
-            # Output is a matrix [len(claims), len(reliable_sources)]
-            cosine_scores = util.cos_sim(claim_embeddings, source_embeddings)
-
-            for i, claim in enumerate(claims):
-                # Find the most similar reliable source
-                best_match_idx = torch.argmax(cosine_scores[i]).item()
-                best_score = cosine_scores[i][best_match_idx].item()
+            claim_embeddings = self._encode(claims).to(source_embeddings.dtype)
+
+            if source_index is not None:
+                # Top-1 nearest trusted source per claim
+                scores, idx = source_index.search(claim_embeddings.float().cpu().numpy(), 1)
+                best_scores, best_ids = scores[:, 0].tolist(), idx[:, 0].tolist()
+            else:
+                # Both sides are normalized, so one matmul gives the cosine matrix
+                # [len(claims), len(reliable_sources)]; take the best source per claim.
+                cosine_scores = torch.mm(claim_embeddings, source_embeddings.t())
+                top_scores, top_idx = cosine_scores.max(dim=1)
+                best_scores, best_ids = top_scores.float().tolist(), top_idx.tolist()
+
+            for claim, best_score, best_match_idx in zip(claims, best_scores, best_ids):
                 best_source = reliable_sources[best_match_idx]
                 
                 status = "Unverified"
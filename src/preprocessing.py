@@ -4,16 +4,33 @@ Uses spaCy for text cleaning, tokenization, and normalization
 """
 
 import spacy
+from spacy.attrs import LEMMA, IS_STOP, IS_PUNCT, IS_ALPHA
 import re
+import hashlib
+import threading
+from collections import OrderedDict
 import config
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 class TextPreprocessor:
+    # URLs run to the first whitespace, angle bracket or quote: one
+    # character class, so matching is a single linear pass with no backtracking
+    _URL_RE = re.compile(r'https?://[^\s<>"\']+')
+    # clean_text passes
+    _STRIP_URL_RE = re.compile(r'http\S+|www\.\S+')
+    _WS_RE = re.compile(r'\s+')
+    _HTML_RE = re.compile(r'<[^>]+>')
+    EXTRACT_CACHE_SIZE = 64
+
     def __init__(self):
         """Initialize preprocessor (SpaCy is loaded lazily)"""
         self._nlp = None
+        # extract_all results by content digest; only the derived lists are kept, never the Doc.
+        # The instance is shared across sessions, hence the lock.
+        self._extract_cache = OrderedDict()
+        self._extract_lock = threading.Lock()
         logger.info("TextPreprocessor initialized (Heuristic-First)")
 
     @property
@@ -42,13 +59,13 @@ class TextPreprocessor:
             return ""
             
         # 1. Remove URLs (and store them? Caller should extract first if needed)
-        text = re.sub(r'http\S+|www\.\S+', '', text)
+        text = self._STRIP_URL_RE.sub('', text)
             
         # 2. Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self._WS_RE.sub(' ', text).strip()
         
         # 3. Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = self._HTML_RE.sub('', text)
         
         # 4. Remove special characters (keep punctuation for sentence segmentation if needed, 
         # but for pure ML/cleaning we often remove them. Keeping basic sentence structure for now)
@@ -58,7 +75,7 @@ class TextPreprocessor:
 
     def extract_urls(self, text: str) -> list[str]:
         """Extract all URLs from text before cleaning"""
-        return re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', text)
+        return self._URL_RE.findall(text)
 
     def clean_and_tokenize(self, text: str) -> str:
         """
@@ -71,21 +88,23 @@ class TextPreprocessor:
         text = self.clean_text(text)
         doc = self.nlp(text)
         
-        # Keep only alphabetic tokens, remove stopwords
-        tokens = [
-            token.lemma_.lower() 
-            for token in doc 
-            if not token.is_stop and not token.is_punct and token.is_alpha
-        ]
-        
-        return " ".join(tokens)
+        # Keep only alphabetic tokens, remove stopwords: the flags are filtered
+        # as one attribute matrix, only the kept lemmas go through the string store
+        arr = doc.to_array([LEMMA, IS_STOP, IS_PUNCT, IS_ALPHA])
+        keep = (arr[:, 1] == 0) & (arr[:, 2] == 0) & (arr[:, 3] == 1)
+        strings = doc.vocab.strings
+        return " ".join(strings[int(h)] for h in arr[keep, 0]).lower()
 
     def extract_claims(self, text: str) -> list[str]:
         """
         Extract sentences that look like factual claims
         Uses dependency parsing and entity recognition
+        Served from extract_all's memoized parse, so calling this alongside
+        get_entities (or extract_all) parses the text only once.
         """
-        doc = self.nlp(self.clean_text(text))
+        return self.extract_all(text)[1]
+
+    def _claims_from_doc(self, doc) -> list[str]:
         claims = []
         
         for sent in doc.sents:
@@ -100,6 +119,31 @@ class TextPreprocessor:
         return claims
 
     def get_entities(self, text: str) -> list[tuple]:
-        """Extract Named Entities"""
-        doc = self.nlp(self.clean_text(text))
-        return [(ent.text, ent.label_) for ent in doc.ents]
+        """Extract Named Entities (shares extract_all's memoized parse)"""
+        return self.extract_all(text)[2]
+
+    def extract_all(self, text: str, cleaned: str | None = None) -> tuple[list[str], list[str], list[tuple]]:
+        """
+        Extract URLs, claims and named entities in one go.
+        URLs are taken from the raw text; claims and entities share a single
+        spaCy parse of the cleaned text instead of one parse each.
+        Pass `cleaned` if clean_text(text) was already computed.
+        Results are memoized per input text (LRU of EXTRACT_CACHE_SIZE), so
+        re-verifying the same article with other scan settings skips the parse.
+        Returns (urls, claims, entities)
+        """
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._extract_lock:
+            hit = self._extract_cache.get(key)
+            if hit is not None:
+                self._extract_cache.move_to_end(key)
+        if hit is None:
+            urls = self.extract_urls(text)
+            doc = self.nlp(cleaned if cleaned is not None else self.clean_text(text))
+            hit = (urls, self._claims_from_doc(doc), [(ent.text, ent.label_) for ent in doc.ents])
+            with self._extract_lock:
+                self._extract_cache[key] = hit
+                while len(self._extract_cache) > self.EXTRACT_CACHE_SIZE:
+                    self._extract_cache.popitem(last=False)
+        # Copies, so callers can't mutate the cached lists
+        return tuple(list(part) for part in hit)
@@ -38,19 +38,27 @@ class SourceVerifier:
             return {"score": 50.0, "status": "Invalid URL", "domain": None}
 
         # Check Trust Lists
-        if any(domain.endswith(trusted) for trusted in self.trusted_domains):
+        if self._matches(domain, self.trusted_domains):
             return {"score": 100.0, "status": "Trusted Source", "domain": domain}
         
-        if any(domain.endswith(sus) for sus in self.suspicious_domains):
+        if self._matches(domain, self.suspicious_domains):
             return {"score": 0.0, "status": "Suspicious/Satire", "domain": domain}
 
         # Neutral / Unknown
         return {"score": 50.0, "status": "Unverified Source", "domain": domain}
 
+    def _matches(self, domain: str, table: set) -> bool:
+        """True if domain or any parent domain (label-wise suffix) is in table: one hash lookup per label"""
+        parts = domain.split('.')
+        for i in range(len(parts) - 1):
+            if '.'.join(parts[i:]) in table:
+                return True
+        return False
+
     def _extract_domain(self, url: str) -> str:
         try:
             parsed = urlparse(url)
             domain = parsed.netloc or parsed.path
-            return domain.lower().replace("www.", "")
+            return domain.lower().removeprefix("www.")
         except:
             return None
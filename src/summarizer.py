@@ -1,56 +1,291 @@
 """
 Article Summarizer
-Generates concise, trustworthy summaries using abstractive summarization.
+Generates concise, trustworthy summaries using abstractive summarization,
+with an extractive (LexRank) fast path for long articles.
 """
 
-from transformers import pipeline
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict, defaultdict
+import numpy as np
+import torch
+from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 import config
 from src.utils.logger import get_logger
+from src.utils.model_cache import build_once
+from src.utils.torch_threads import configure_torch_threads
+from src.utils.micro_batcher import MicroBatcher
+
+try:
+    # Optional: ONNX Runtime int8 backend for the summarizer
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForSeq2SeqLM = None
 
 logger = get_logger(__name__)
+# No-op when app startup already did it; covers use outside the app
+configure_torch_threads()
+
+def _cpu_has_bf16() -> bool:
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except Exception:
+        return False
+
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+_WORD_RE = re.compile(r"[a-z0-9']+")
+# Built once at import; only used to keep function words out of the sentence graph
+_STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each
+few for from further had has have having he her here hers herself him himself his how
+i if in into is it its itself just me more most my myself no nor not now of off on once
+only or other our ours ourselves out over own said same she should so some such than
+that the their theirs them themselves then there these they this those through to too
+under until up very was we were what when where which while who whom why will with
+would you your yours yourself yourselves
+""".split())
+
+def _lexrank_summary(text: str, sentences_count: int, threshold: float = 0.1, damping: float = 0.85) -> str:
+    """
+    Extractive summary: rank sentences by centrality in their cosine-similarity
+    graph (LexRank) and return the top `sentences_count` in article order.
+    """
+    sentences = [s.strip() for s in _SENTENCE_RE.split(text) if s.strip()]
+    if len(sentences) <= sentences_count:
+        return " ".join(sentences)
+
+    vocab = {}
+    rows, cols = [], []
+    for i, sentence in enumerate(sentences):
+        for word in _WORD_RE.findall(sentence.lower()):
+            if word not in _STOP_WORDS:
+                rows.append(i)
+                cols.append(vocab.setdefault(word, len(vocab)))
+    tf = np.zeros((len(sentences), max(len(vocab), 1)), dtype=np.float32)
+    np.add.at(tf, (rows, cols), 1.0)
+    norms = np.linalg.norm(tf, axis=1, keepdims=True)
+    tf /= np.where(norms == 0, 1.0, norms)
+
+    # Thresholded similarity graph, row-normalised into a transition matrix
+    graph = (tf @ tf.T > threshold).astype(np.float32)
+    np.fill_diagonal(graph, 0.0) # A sentence doesn't vote for itself
+    graph /= graph.sum(axis=1, keepdims=True).clip(min=1.0)
+    n = len(sentences)
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(50):
+        updated = (1 - damping) / n + damping * (graph.T @ scores)
+        if np.abs(updated - scores).sum() < 1e-5:
+            break
+        scores = updated
+
+    top = np.sort(np.argsort(-scores, kind="stable")[:sentences_count])
+    return " ".join(sentences[i] for i in top)
 
 class Summarizer:
+    # Inputs are batched per token-length bucket, so short articles aren't padded to long ones
+    LENGTH_BUCKETS = (128, 256, 512, 1024)
+    SUMMARY_CACHE_SIZE = 1024
+    MIN_WORDS = 30 # below this the text is returned as its own summary
+    EXTRACTIVE_SENTENCES = 5
+
     def __init__(self):
         self.model_name = "sshleifer/distilbart-cnn-6-6" # Ultra-fast distillation
-        self.pipeline = None
+        self.tokenizer = None
+        self.model = None
+        # Summaries by (input digest, lengths); decoding never samples, so identical
+        # input always yields the same summary. Shared across sessions, hence the lock.
+        self._summary_cache = OrderedDict()
+        self._summary_lock = threading.Lock()
         self._load_model()
+        # Concurrent default-length requests (other sessions' scans) share one generate call
+        self._batcher = MicroBatcher(self.summarize_batch, max_batch=8, window=0.05, name="summary-batcher")
         
+    def _onnx_int8_model(self):
+        """
+        Load the int8 ONNX export (encoder and decoders) of the summarizer,
+        exporting and quantizing each graph into MODEL_CACHE_DIR on first use.
+        """
+        def export(save_dir):
+            logger.info("Exporting summarizer to ONNX (int8, one-time)...")
+            export_dir = os.path.join(config.MODEL_CACHE_DIR, "onnx_distilbart_fp32")
+            ORTModelForSeq2SeqLM.from_pretrained(self.model_name, export=True).save_pretrained(export_dir)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            for onnx_file in sorted(f for f in os.listdir(export_dir) if f.endswith(".onnx")):
+                ORTQuantizer.from_pretrained(export_dir, file_name=onnx_file).quantize(
+                    save_dir=save_dir, quantization_config=qconfig
+                )
+
+        save_dir = build_once(
+            os.path.join(config.MODEL_CACHE_DIR, "onnx_distilbart_int8"), "encoder_model_quantized.onnx", export
+        )
+        files = {
+            "encoder_file_name": "encoder_model_quantized.onnx",
+            "decoder_file_name": "decoder_model_quantized.onnx",
+            "decoder_with_past_file_name": "decoder_with_past_model_quantized.onnx",
+        }
+        files = {arg: name for arg, name in files.items() if os.path.exists(os.path.join(save_dir, name))}
+        return ORTModelForSeq2SeqLM.from_pretrained(save_dir, **files)
+
     def _load_model(self):
+        # Tokenizer and model are driven directly (see summarize_batch), without a pipeline wrapper
+        try:
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+        except Exception as e:
+            logger.error(f"Failed to load summarizer: {e}")
+            return
+        if ORTModelForSeq2SeqLM is not None and not config.FORCE_FP32:
+            try:
+                logger.info(f"Loading Summarization model: {self.model_name} (ONNX Runtime int8)")
+                self.model = self._onnx_int8_model()
+                return
+            except Exception as e:
+                logger.warning(f"ONNX summarizer unavailable, using PyTorch: {e}")
         try:
             logger.info(f"Loading Summarization model: {self.model_name}")
-            self.pipeline = pipeline(
-                "summarization", 
-                model=self.model_name,
-                device=-1 # CPU
-            )
+            try:
+                # PyTorch's fused scaled-dot-product attention kernel instead of the eager matmuls
+                model = AutoModelForSeq2SeqLM.from_pretrained(
+                    self.model_name, low_cpu_mem_usage=True, attn_implementation="sdpa"
+                ).eval() # CPU
+            except (TypeError, ValueError):
+                model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name, low_cpu_mem_usage=True).eval()
+            # Runs on CPU: bfloat16 weights where the CPU has native BF16 dot products
+            # (AVX-512 BF16 / AMX), otherwise dynamic int8 quantization of the Linear layers
+            if not config.FORCE_FP32 and _cpu_has_bf16():
+                model = model.to(torch.bfloat16)
+                logger.info("Cast summarizer model to bfloat16")
+            elif not config.FORCE_FP32:
+                model = torch.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info("Applied int8 dynamic quantization to summarizer model")
+            if config.SUMMARY_TORCH_COMPILE:
+                self._compile(model)
+            self.model = model
         except Exception as e:
             logger.error(f"Failed to load summarizer: {e}")
             
+    def _compile(self, model):
+        """
+        Compile the model's forward pass (generate() keeps its Python loop) and
+        run one short generate so compilation happens at load, not in a scan.
+        """
+        try:
+            model.forward = torch.compile(model.forward, mode="reduce-overhead", dynamic=True)
+            warmup = self.tokenizer(["Warm-up input for the compiled summarizer."], return_tensors="pt")
+            with torch.inference_mode():
+                model.generate(**warmup, max_length=8, num_beams=config.SUMMARY_NUM_BEAMS)
+            logger.info("Compiled summarizer model with torch.compile")
+        except Exception as e:
+            model.__dict__.pop("forward", None) # Back to the eager forward
+            logger.warning(f"torch.compile unavailable for summarizer, running eagerly: {e}")
+
     def generate_summary(self, text: str, max_length: int = 150, min_length: int = 50) -> str:
         """
         Generate summary of the text
         """
-        if not text or not self.pipeline:
+        if not text:
             return "Summary unavailable."
-            
-        try:
+        if self._is_short(text):
+            return text # Too short to summarize
+        if config.FAST_SUMMARY or self._is_long(text):
+            # Long articles would be cut to their first 4000 chars for the model anyway.
+            # Needs no model, so it also works when the summarizer failed to load.
+            return _lexrank_summary(text, self.EXTRACTIVE_SENTENCES)
+        if self.model is None:
+            return "Summary unavailable."
+        # Repeat articles skip the batching window as well as the model
+        hit = self._cached_summary(self._summary_key(text[:4000], max_length, min_length))
+        if hit is not None:
+            return hit
+        if (max_length, min_length) == (150, 50):
+            return self._batcher.submit(text).result()
+        return self.summarize_batch([text], max_length, min_length)[0]
+
+    @classmethod
+    def _is_short(cls, text: str) -> bool:
+        # N words need at least 2N-1 chars; past that, split at most MIN_WORDS
+        # ways instead of building a list of every word in the article
+        if len(text) < 2 * cls.MIN_WORDS - 1:
+            return True
+        return len(text.split(maxsplit=cls.MIN_WORDS - 1)) < cls.MIN_WORDS
+
+    @staticmethod
+    def _is_long(text: str) -> bool:
+        limit = config.SUMMARY_EXTRACTIVE_MIN_WORDS
+        return len(text.split(maxsplit=limit)) > limit
+
+    @staticmethod
+    def _summary_key(input_text: str, max_length: int, min_length: int) -> tuple:
+        return (hashlib.blake2b(input_text.encode("utf-8"), digest_size=16).digest(), max_length, min_length)
+
+    def _cached_summary(self, key):
+        with self._summary_lock:
+            hit = self._summary_cache.get(key)
+            if hit is not None:
+                self._summary_cache.move_to_end(key)
+        return hit
+
+    def summarize_batch(self, texts: list[str], max_length: int = 150, min_length: int = 50) -> list[str]:
+        """
+        Summarize several texts, one generate call per length bucket.
+        Returns one summary per input, in order.
+        """
+        if self.model is None:
+            return ["Summary unavailable." for _ in texts]
+        results = []
+        pending = [] # (position, model input, cache key)
+        for i, text in enumerate(texts):
+            if not text:
+                results.append("Summary unavailable.")
             # Handle text length limitations of the model
-            input_len = len(text.split())
-            if input_len < 30:
-                return text # Too short to summarize
-                
-            # Truncate input to model's likely max limit (~1024 tokens)
-            # Rough char limit 4000
-            input_text = text[:4000]
-            
-            summary_output = self.pipeline(
-                input_text, 
-                max_length=max_length, 
-                min_length=min_length, 
-                do_sample=False
-            )
-            
-            return summary_output[0]['summary_text']
+            elif self._is_short(text):
+                results.append(text) # Too short to summarize
+            else:
+                # Truncate input to model's likely max limit (~1024 tokens)
+                # Rough char limit 4000
+                input_text = text[:4000]
+                key = self._summary_key(input_text, max_length, min_length)
+                hit = self._cached_summary(key)
+                results.append(hit)
+                if hit is None:
+                    pending.append((i, input_text, key))
+        if not pending:
+            return results
+
+        try:
+            tokenizer, model = self.tokenizer, self.model
+            encoded = tokenizer(
+                [text for _, text, _ in pending], truncation=True, max_length=self.LENGTH_BUCKETS[-1]
+            )["input_ids"]
+            buckets = defaultdict(list)
+            for (i, _, key), ids in zip(pending, encoded):
+                buckets[next(b for b in self.LENGTH_BUCKETS if len(ids) <= b)].append((i, key, ids))
+            for items in buckets.values():
+                # Pad to the bucket's longest input, rounded up to aligned GEMM tiles
+                batch = tokenizer.pad(
+                    {"input_ids": [ids for _, _, ids in items]},
+                    padding="longest", pad_to_multiple_of=8, return_tensors="pt"
+                )
+                with torch.inference_mode():
+                    num_beams = config.SUMMARY_NUM_BEAMS
+                    output_ids = model.generate(
+                        **batch, max_length=max_length, min_length=min_length, do_sample=False, use_cache=True,
+                        num_beams=num_beams, early_stopping=num_beams > 1, no_repeat_ngram_size=3
+                    )
+                summaries = tokenizer.batch_decode(output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True)
+                with self._summary_lock:
+                    for (i, key, _), summary in zip(items, summaries):
+                        results[i] = self._summary_cache[key] = summary.strip()
+                    while len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+                        self._summary_cache.popitem(last=False)
         except Exception as e:
             logger.error(f"Summarization error: {e}")
-            return "Error generating summary."
+            for i, _, _ in pending:
+                if results[i] is None:
+                    results[i] = "Error generating summary."
+        return results
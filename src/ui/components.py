@@ -2,25 +2,69 @@
 Reusable UI Components for VeriSense
 """
 
+import hashlib
+import math
 import streamlit as st
-import plotly.graph_objects as go
 import config
 
+@st.cache_resource
+def _read_css(path="assets/styles.css"):
+    """Read the stylesheet once per process"""
+    with open(path) as f:
+        return f"<style>{f.read()}</style>"
+
 def load_css():
     """Load custom CSS"""
-    with open("assets/styles.css") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    # The <style> block must be emitted on every run or Streamlit drops it,
+    # so only the file read is cached.
+    st.markdown(_read_css(), unsafe_allow_html=True)
 
 def header_section(show_nav=False):
     """Render application header"""
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        st.markdown(f"## 🛡️ {config.APP_TITLE}")
-        st.caption(config.APP_SUBTITLE)
-    
-    if show_nav:
-        with col2:
-            pass # Nav items handled in sidebar or explicit buttons usually
+    # No column split: the nav slot was always empty (nav lives in the sidebar)
+    st.markdown(f"## 🛡️ {config.APP_TITLE}")
+    st.caption(config.APP_SUBTITLE)
+
+# Semicircular gauge: radius-80 track centred at (100, 100); {arc} is the value arc
+_GAUGE_SVG = (
+    "<div style='text-align:center;'>"
+    "<div style='color:#14B8A6;font-family:Outfit;font-size:20px;'>Confidence Index</div>"
+    "<svg viewBox='0 0 200 122' style='width:100%;max-width:380px;'>"
+    "<path d='M 20 100 A 80 80 0 0 1 180 100' fill='none' stroke='rgba(15, 23, 42, 0.5)' stroke-width='18'/>"
+    "{arc}"
+    "<text x='100' y='94' text-anchor='middle' fill='#FFFFFF' font-family='Outfit' font-size='34'>{value}</text>"
+    "<text x='20' y='120' text-anchor='middle' fill='#94A3B8' font-size='9'>0</text>"
+    "<text x='180' y='120' text-anchor='middle' fill='#94A3B8' font-size='9'>100</text>"
+    "</svg></div>"
+)
+
+# Plotly gauge (config.PLOTLY_GAUGE) as a plain figure dict, built once at import
+_GAUGE_FIGURE = {
+    "data": [{
+        "type": "indicator",
+        "mode": "gauge+number",
+        "value": 0,
+        "number": {'font': {'color': '#FFFFFF', 'family': 'Outfit', 'size': 44}},
+        "domain": {'x': [0, 1], 'y': [0, 1]},
+        "title": {'text': "Confidence Index", 'font': {'color': '#14B8A6', 'family': 'Outfit', 'size': 20}},
+        "gauge": {
+            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "#94A3B8"},
+            'bar': {'color': "#14B8A6"},
+            'bgcolor': "rgba(30, 41, 59, 0.4)",
+            'borderwidth': 1,
+            'bordercolor': "rgba(148, 163, 184, 0.1)",
+            'steps': [
+                {'range': [0, 100], 'color': 'rgba(15, 23, 42, 0.5)'}],
+        },
+    }],
+    "layout": {
+        'paper_bgcolor': 'rgba(0,0,0,0)',
+        'plot_bgcolor': 'rgba(0,0,0,0)',
+        'height': 320,
+        'margin': dict(l=40, r=40, t=60, b=20),
+        'font': {'family': "Inter"},
+    },
+}
 
 def credibility_gauge(score: float):
     """Futuristic Cyber Credibility Gauge"""
@@ -31,32 +75,28 @@ def credibility_gauge(score: float):
         color = "#EF4444" # Neon Red
     elif score < 70:
         color = "#F59E0B" # Neon Amber
-        
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number",
-        value = score,
-        number = {'font': {'color': '#FFFFFF', 'family': 'Outfit', 'size': 44}},
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': "Confidence Index", 'font': {'color': '#14B8A6', 'family': 'Outfit', 'size': 20}},
-        gauge = {
-            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "#94A3B8"},
-            'bar': {'color': color},
-            'bgcolor': "rgba(30, 41, 59, 0.4)",
-            'borderwidth': 1,
-            'bordercolor': "rgba(148, 163, 184, 0.1)",
-            'steps': [
-                {'range': [0, 100], 'color': 'rgba(15, 23, 42, 0.5)'}],
-        }
-    ))
-    
-    fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        height=320, 
-        margin=dict(l=40, r=40, t=60, b=20),
-        font={'family': "Inter"}
-    )
-    st.plotly_chart(fig, use_container_width=True)
+
+    if not config.PLOTLY_GAUGE:
+        # Inline SVG: no Plotly bundle or figure spec sent on every rerun
+        fraction = min(max(score, 0.0), 100.0) / 100.0
+        arc = ""
+        if fraction > 0:
+            x = 100 - 80 * math.cos(math.pi * fraction)
+            y = 100 - 80 * math.sin(math.pi * fraction)
+            arc = (
+                f"<path d='M 20 100 A 80 80 0 0 1 {x:.2f} {y:.2f}' fill='none' "
+                f"stroke='{color}' stroke-width='18'/>"
+            )
+        st.markdown(_GAUGE_SVG.format(arc=arc, value=f"{score:g}"), unsafe_allow_html=True)
+        return
+
+    # Only the score and bar colour vary; the shared template itself is never mutated
+    trace = _GAUGE_FIGURE["data"][0]
+    figure = {
+        "data": [{**trace, "value": score, "gauge": {**trace["gauge"], "bar": {"color": color}}}],
+        "layout": _GAUGE_FIGURE["layout"],
+    }
+    st.plotly_chart(figure, use_container_width=True)
 
 def result_card(title, value, type="neutral"):
     """Glassmorphic Cyber Result Card"""
@@ -79,18 +119,54 @@ def result_card(title, value, type="neutral"):
         unsafe_allow_html=True
     )
 
+_CLAIM_ICONS = {'Verified': "✅", 'Related': "⚠️"}
+
 def similarity_breakdown(verified_claims):
     """Render list of verified claims"""
     if not verified_claims:
         st.info("No verifiable claims detected.")
         return
 
-    for claim in verified_claims:
-        icon = "✅" if claim['status'] == 'Verified' else "⚠️" if claim['status'] == 'Related' else "❓"
-        with st.expander(f"{icon} {claim['claim'][:60]}..."):
-            st.markdown(f"**Claim:** {claim['claim']}")
-            st.markdown(f"**Match:** {claim['match_source']}")
-            st.markdown(f"**Similarity:** {int(claim['similarity_score']*100)}%")
+    # One table element for all claims instead of an expander and three markdowns per claim
+    rows = [
+        {
+            "": _CLAIM_ICONS.get(claim['status'], "❓"),
+            "Claim": claim['claim'],
+            "Match": claim['match_source'],
+            "Similarity": claim['similarity_score'] * 100,
+        }
+        for claim in verified_claims
+    ]
+    st.dataframe(
+        rows,
+        column_config={
+            "Claim": st.column_config.TextColumn(width="large"),
+            "Similarity": st.column_config.ProgressColumn(min_value=0, max_value=100, format="%.0f%%"),
+        },
+        use_container_width=True,
+        hide_index=True,
+    )
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _render_shap_png(key: str, _explanation) -> bytes:
+    """Rasterize a SHAP bar plot once per distinct explanation; `key` identifies it"""
+    # Deferred until there is something to plot
+    import io
+    import shap
+    import matplotlib.pyplot as plt
+
+    # Create a matplotlib figure
+    fig, ax = plt.subplots(figsize=(10, 3))
+    try:
+        # shap.plots.text is interactive and hard to embed static
+        # shap.plots.bar is easier
+        shap.plots.bar(_explanation, show=False)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=90, bbox_inches="tight")
+        return buf.getvalue()
+    finally:
+        # Closing releases the figure from pyplot's registry
+        plt.close(fig)
 
 def shap_plot_placeholder(shap_values):
     """
@@ -98,20 +174,15 @@ def shap_plot_placeholder(shap_values):
     Note: Full SHAP JS visualization in Streamlit is tricky without components.
     We will use a static matplotlib plot for stability or text highlighting.
     """
-    import shap
-    import matplotlib.pyplot as plt
-    
     if shap_values is None:
         st.warning("Interpretation unavailable.")
         return
         
     try:
-        # Create a matplotlib figure
-        fig, ax = plt.subplots(figsize=(10, 3))
-        # shap.plots.text is interactive and hard to embed static
-        # shap.plots.bar is easier
-        shap.plots.bar(shap_values[0], show=False)
-        st.pyplot(plt.gcf())
-        plt.clf()
+        explanation = shap_values[0]
+        digest = hashlib.blake2b(explanation.values.tobytes(), digest_size=16)
+        digest.update(repr(explanation.feature_names).encode("utf-8"))
+        # Same values and labels give the same image: skip matplotlib on reruns
+        st.image(_render_shap_png(digest.hexdigest(), explanation))
     except Exception as e:
         st.error("Could not render explanation plot.")
@@ -3,10 +3,56 @@ Logger Utility
 Configures logging for the application
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
+from functools import lru_cache
 
+LOG_DIR = "logs"
+# Checked once at import rather than on every get_logger call
+_LOGS_DIR_EXISTS = os.path.isdir(LOG_DIR)
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+@lru_cache(maxsize=1)
+def _shared_handlers():
+    """
+    Queue handler shared by every logger. Callers only enqueue records;
+    a single listener thread does the console and file writes, so request
+    threads never block on log I/O and app.log is opened once per process.
+    """
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(_FORMATTER)
+    handlers = [console_handler]
+    
+    if _LOGS_DIR_EXISTS:
+        file_handler = logging.handlers.RotatingFileHandler(
+            os.path.join(LOG_DIR, "app.log"),
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUPS
+        )
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(file_handler)
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Drain whatever is still queued on interpreter shutdown
+    atexit.register(listener.stop)
+    
+    return (logging.handlers.QueueHandler(log_queue),)
+
+@lru_cache(maxsize=None)
 def get_logger(name: str):
     """
     Get a configured logger instance
@@ -15,27 +61,7 @@ def get_logger(name: str):
     
     if not logger.handlers:
         logger.setLevel(logging.INFO)
-        
-        # Create console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(formatter)
-        
-        # Add handler to logger
-        logger.addHandler(console_handler)
-        
-        # Create file handler if logs directory exists
-        log_dir = "logs"
-        if os.path.exists(log_dir):
-            file_handler = logging.FileHandler(os.path.join(log_dir, "app.log"))
-            file_handler.setLevel(logging.INFO)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+        for handler in _shared_handlers():
+            logger.addHandler(handler)
     
     return logger
@@ -4,6 +4,9 @@ Provides SMTP support for OTP emails with a fallback simulator.
 """
 
 import smtplib
+import string
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
@@ -11,6 +14,29 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+OTP_SUBJECT = "🛡️ Reliable Reads: Your Verification Code"
+# Built once; each send only substitutes the code
+_OTP_BODY_TMPL = string.Template("""
+        <html>
+        <body style="font-family: sans-serif; color: #334155;">
+            <div style="max-width: 600px; margin: 40px auto; padding: 20px; border: 1px solid #E2E8F0; border-radius: 8px;">
+                <h2 style="color: #2563EB; border-bottom: 2px solid #F1F5F9; padding-bottom: 10px;">Verification Required</h2>
+                <p>Hello,</p>
+                <p>To access the <b>Reliable Reads</b> Verification Studio, please use the following one-time code:</p>
+                <div style="background-color: #F8FAFC; padding: 20px; text-align: center; border-radius: 6px; margin: 20px 0;">
+                    <span style="font-size: 2rem; font-weight: 800; letter-spacing: 0.2em; color: #0F172A;">$otp_code</span>
+                </div>
+                <p style="font-size: 0.875rem; color: #64748B;">This code will expire in 5 minutes. If you did not request this code, please ignore this email.</p>
+                <hr style="border: none; border-top: 1px solid #F1F5F9; margin: 20px 0;">
+                <p style="font-size: 0.75rem; color: #94A3B8; text-align: center;">🛡️ Reliable Reads | Advanced AI News Verification</p>
+            </div>
+        </body>
+        </html>
+        """)
+
+# Sends run here so the login request never waits on SMTP
+_send_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="smtp-sender")
+
 class MailHandler:
     def __init__(self):
         self.smtp_server = os.getenv("SMTP_SERVER")
@@ -22,54 +48,65 @@ class MailHandler:
         self.enabled = all([self.smtp_server, self.smtp_user, self.smtp_pass])
         if not self.enabled:
             logger.warning("SMTP credentials not found. MailHandler running in SIMULATION mode.")
+        # One logged-in connection reused across sends (TLS + LOGIN once), guarded by a lock
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
 
     @property
     def is_simulated(self):
         return not self.enabled
 
-    def send_otp(self, receiver_email, otp_code):
-        """Send OTP via SMTP or simulate if not configured"""
-        subject = "🛡️ Reliable Reads: Your Verification Code"
-        body = f"""
-        <html>
-        <body style="font-family: sans-serif; color: #334155;">
-            <div style="max-width: 600px; margin: 40px auto; padding: 20px; border: 1px solid #E2E8F0; border-radius: 8px;">
-                <h2 style="color: #2563EB; border-bottom: 2px solid #F1F5F9; padding-bottom: 10px;">Verification Required</h2>
-                <p>Hello,</p>
-                <p>To access the <b>Reliable Reads</b> Verification Studio, please use the following one-time code:</p>
-                <div style="background-color: #F8FAFC; padding: 20px; text-align: center; border-radius: 6px; margin: 20px 0;">
-                    <span style="font-size: 2rem; font-weight: 800; letter-spacing: 0.2em; color: #0F172A;">{otp_code}</span>
-                </div>
-                <p style="font-size: 0.875rem; color: #64748B;">This code will expire in 5 minutes. If you did not request this code, please ignore this email.</p>
-                <hr style="border: none; border-top: 1px solid #F1F5F9; margin: 20px 0;">
-                <p style="font-size: 0.75rem; color: #94A3B8; text-align: center;">🛡️ Reliable Reads | Advanced AI News Verification</p>
-            </div>
-        </body>
-        </html>
+    def send_otp(self, receiver_email, otp_code) -> Future:
         """
-        
-        if self.enabled:
-            try:
-                msg = MIMEMultipart()
-                msg['From'] = self.smtp_user
-                msg['To'] = receiver_email
-                msg['Subject'] = subject
-                msg.attach(MIMEText(body, 'html'))
-                
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    server.starttls()
-                    server.login(self.smtp_user, self.smtp_pass)
-                    server.send_message(msg)
-                
-                logger.info(f"OTP sent successfully to {receiver_email}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to send email via SMTP: {e}")
-                self._print_sim(receiver_email, otp_code)
-                return False
-        else:
+        Send OTP via SMTP or simulate if not configured.
+        Returns immediately; the Future resolves to True once the mail is handed to SMTP.
+        """
+        if not self.enabled:
             self._print_sim(receiver_email, otp_code)
+            done = Future()
+            done.set_result(True)
+            return done
+        return _send_pool.submit(self._send_sync, receiver_email, otp_code)
+
+    def _connect(self):
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.smtp_user, self.smtp_pass)
+        return server
+
+    def _deliver(self, msg):
+        with self._smtp_lock:
+            if self._smtp is None:
+                self._smtp = self._connect()
+            try:
+                self._smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Idle connections get dropped by the server: reconnect once and retry
+                self._smtp = self._connect()
+                self._smtp.send_message(msg)
+
+    def _send_sync(self, receiver_email, otp_code):
+        
+        try:
+            msg = MIMEMultipart()
+            msg['From'] = self.smtp_user
+            msg['To'] = receiver_email
+            msg['Subject'] = OTP_SUBJECT
+            msg.attach(MIMEText(_OTP_BODY_TMPL.substitute(otp_code=otp_code), 'html', 'utf-8'))
+            
+            self._deliver(msg)
+            
+            logger.info(f"OTP sent successfully to {receiver_email}")
             return True
+        except Exception as e:
+            logger.error(f"Failed to send email via SMTP: {e}")
+            with self._smtp_lock:
+                # Start from a fresh connection next time
+                if self._smtp is not None:
+                    self._smtp.close()
+                self._smtp = None
+            self._print_sim(receiver_email, otp_code)
+            return False
 
     def _print_sim(self, email, otp):
         print("\n" + "="*50)
@@ -0,0 +1,54 @@
+"""
+Micro-Batcher Utility
+Coalesces concurrent single-item model calls into one batched call
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class MicroBatcher:
+    """
+    Collects items submitted from any thread for up to `window` seconds
+    (or until `max_batch` are waiting) and runs them through
+    `batch_fn(items) -> results` in one call on a background thread.
+    Each submit returns a Future for that item's result.
+    """
+
+    def __init__(self, batch_fn, max_batch: int = 32, window: float = 0.005, name: str = "micro-batcher"):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.window = window
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item) -> Future:
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # Give concurrent callers a short window to join this batch
+            deadline = time.monotonic() + self.window
+            try:
+                while len(batch) < self.max_batch:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+            except queue.Empty:
+                pass
+            items = [item for item, _ in batch]
+            try:
+                results = self.batch_fn(items)
+            except Exception as e:
+                logger.error(f"Batched call failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
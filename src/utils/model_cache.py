@@ -0,0 +1,41 @@
+"""
+Model Cache Utility
+Builds one-time model exports (ONNX, quantized) into MODEL_CACHE_DIR atomically
+"""
+
+import os
+import shutil
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def build_once(save_dir: str, required_file: str, build) -> str:
+    """
+    Return `save_dir`, first running `build(tmp_dir)` if it isn't complete yet.
+    The export is written to a scratch directory and renamed into place only
+    after `build` succeeds, so an interrupted or failed export never looks
+    cached. A directory missing `required_file` (left by older, non-atomic
+    exports) is discarded and rebuilt.
+    """
+    if os.path.exists(os.path.join(save_dir, required_file)):
+        return save_dir
+    if os.path.isdir(save_dir):
+        logger.warning(f"Discarding incomplete model export: {save_dir}")
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+    tmp_dir = f"{save_dir}.partial-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    try:
+        build(tmp_dir)
+        if not os.path.exists(os.path.join(tmp_dir, required_file)):
+            raise FileNotFoundError(f"Export did not produce {required_file}")
+        os.replace(tmp_dir, save_dir)
+    except OSError:
+        # Another process may have finished the same export first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not os.path.exists(os.path.join(save_dir, required_file)):
+            raise
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return save_dir
@@ -0,0 +1,30 @@
+"""
+Torch Thread Setup
+Process-wide CPU thread caps shared by every model layer
+"""
+
+from functools import lru_cache
+import config
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+@lru_cache(maxsize=1)
+def configure_torch_threads() -> bool:
+    """
+    Cap torch's intra-op threads at config.TORCH_NUM_THREADS and use a single
+    inter-op thread. Call before the first model is built; repeat calls are
+    free. Layers already infer side by side on the layer pool, so each forward
+    spreading over every core would oversubscribe the CPU. Returns False
+    without torch.
+    """
+    try:
+        import torch
+    except ImportError:
+        return False
+    torch.set_num_threads(config.TORCH_NUM_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError as e:
+        logger.warning(f"Inter-op thread count already fixed: {e}")
+    return True